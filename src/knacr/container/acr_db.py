@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 import re
-from typing import Annotated, Final, final
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Final, final
 from pydantic import (
     BaseModel,
     Field,
@@ -34,7 +35,7 @@ class AcrChaT(str, Enum):
 
 @final
 class AcrChaCon(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid")
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
 
     id: Annotated[int, Field(gt=0)]
     type: AcrChaT
@@ -42,7 +43,9 @@ class AcrChaCon(BaseModel):
 
 @final
 class AcrCoreReg(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=False)
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False, defer_build=True
+    )
 
     full: Annotated[str, Field(min_length=2), AfterValidator(_is_regex)]
     core: Annotated[str, Field(min_length=2), AfterValidator(_is_regex)] = ""
@@ -52,7 +55,9 @@ class AcrCoreReg(BaseModel):
 
 @final
 class AcrDbEntry(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=False)
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", validate_default=False, defer_build=True
+    )
 
     acr: Annotated[str, Field(min_length=2, pattern=r"^[A-Z:]+$")]
     code: Annotated[str, Field(min_length=2, pattern=r"^[A-Z:]+$")]
@@ -72,20 +77,53 @@ class AcrDbEntry(BaseModel):
     )
 
 
-ACR_DB_KEYS: Final = TypeAdapter(list[Annotated[str, Field(pattern="^[1-9][0-9]*$")]])
+type _DB_KEYS_T = list[Annotated[str, Field(pattern="^[1-9][0-9]*$")]]
+
+
+@cache
+def get_db_keys_adapter() -> TypeAdapter[_DB_KEYS_T]:
+    return TypeAdapter(_DB_KEYS_T)
 
 
 @final
 class AcrDbMinEntry(BaseModel):
-    model_config = ConfigDict(frozen=True, extra="ignore")
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
 
     acr: Annotated[str, Field(min_length=2, pattern=r"^[A-Z:]+$")]
     deprecated: bool = False
 
 
-ACR_MIN_CON = TypeAdapter(list[AcrDbMinEntry])
-CCNO_DB_CON: Final = TypeAdapter(list[list[Annotated[str, Field(min_length=3)]]])
-CCNO_DB_KEYS: Final = TypeAdapter(list[Annotated[str, Field(pattern="^[1-9][0-9]*$")]])
+@cache
+def get_acr_min_adapter() -> TypeAdapter[list[AcrDbMinEntry]]:
+    return TypeAdapter(list[AcrDbMinEntry])
+
+
+type _CCNO_DB_CON_T = list[list[Annotated[str, Field(min_length=3)]]]
+
+
+@cache
+def get_ccno_db_adapter() -> TypeAdapter[_CCNO_DB_CON_T]:
+    return TypeAdapter(_CCNO_DB_CON_T)
+
+
+_LAZY_ADAPTERS: Final[dict[str, Callable[[], TypeAdapter[Any]]]] = {
+    "ACR_DB_KEYS": get_db_keys_adapter,
+    "ACR_MIN_CON": get_acr_min_adapter,
+    "CCNO_DB_CON": get_ccno_db_adapter,
+    "CCNO_DB_KEYS": get_db_keys_adapter,
+}
+
+if TYPE_CHECKING:
+    ACR_DB_KEYS: TypeAdapter[_DB_KEYS_T]
+    ACR_MIN_CON: TypeAdapter[list[AcrDbMinEntry]]
+    CCNO_DB_CON: TypeAdapter[_CCNO_DB_CON_T]
+    CCNO_DB_KEYS: TypeAdapter[_DB_KEYS_T]
+
+
+def __getattr__(name: str) -> TypeAdapter[Any]:
+    if (create := _LAZY_ADAPTERS.get(name, None)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return create()
 
 
 @final
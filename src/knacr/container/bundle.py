@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import final
+
+from knacr.constants.types import ACR_DB_T, CCNO_DB_T
+from knacr.container.index import AcrDbIndex
+from knacr.container.successor import AcrSuccessors
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DbBundle:
+    version: str
+    acr_db: ACR_DB_T
+    regex_db: CCNO_DB_T
+    catalogue_db: CCNO_DB_T
+    index: AcrDbIndex
+    successors: AcrSuccessors
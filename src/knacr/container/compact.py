@@ -0,0 +1,126 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+import sys
+from typing import Any, final
+
+from pydantic import HttpUrl
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import AcrDbEntry
+from knacr.container.fun.acr_db import create_acr_db_entry
+from knacr.container.fun.format import uuid_to_str
+from knacr.errors.custom_exceptions import ValJsonEx
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class CompactAcrEntry:
+    acr: str
+    code: str
+    name: str
+    country: str
+    active: bool
+    deprecated: bool
+    regex_ccno: str
+    regex_id: tuple[str, str, str, str]
+    ror: str
+    gbif: str
+    homepage: str
+    catalogue: tuple[str, ...]
+    acr_changed_to: tuple[tuple[int, str], ...]
+    acr_synonym: tuple[str, ...]
+
+
+def _url_to_raw(url: HttpUrl | None, /) -> str:
+    return "" if url is None else url.unicode_string()
+
+
+def _create_compact_entry(acr_con: AcrDbEntry, /) -> CompactAcrEntry:
+    reg = acr_con.regex_id
+    return CompactAcrEntry(
+        acr=sys.intern(acr_con.acr),
+        code=sys.intern(acr_con.code),
+        name=acr_con.name,
+        country=sys.intern(acr_con.country),
+        active=acr_con.active,
+        deprecated=acr_con.deprecated,
+        regex_ccno=acr_con.regex_ccno,
+        regex_id=(
+            sys.intern(reg.full),
+            sys.intern(reg.core),
+            sys.intern(reg.pre),
+            sys.intern(reg.suf),
+        ),
+        ror=acr_con.ror,
+        gbif=uuid_to_str(acr_con.gbif),
+        homepage=sys.intern(_url_to_raw(acr_con.homepage)),
+        catalogue=tuple(_url_to_raw(cat) for cat in acr_con.catalogue),
+        acr_changed_to=tuple(
+            (cha.id, sys.intern(cha.type.value)) for cha in acr_con.acr_changed_to
+        ),
+        acr_synonym=tuple(sys.intern(syn) for syn in acr_con.acr_synonym),
+    )
+
+
+def _to_raw(entry: CompactAcrEntry, /) -> dict[str, Any]:
+    full, core, pre, suf = entry.regex_id
+    raw: dict[str, Any] = {
+        "acr": entry.acr,
+        "code": entry.code,
+        "name": entry.name,
+        "country": entry.country,
+        "active": entry.active,
+        "deprecated": entry.deprecated,
+        "regex_ccno": entry.regex_ccno,
+        "regex_id": {
+            key: val
+            for key, val in [("full", full), ("core", core), ("pre", pre), ("suf", suf)]
+            if val != ""
+        },
+        "catalogue": list(entry.catalogue),
+        "acr_changed_to": [
+            {"id": cha_id, "type": cha_type} for cha_id, cha_type in entry.acr_changed_to
+        ],
+        "acr_synonym": list(entry.acr_synonym),
+    }
+    for key, val in [
+        ("ror", entry.ror),
+        ("gbif", entry.gbif),
+        ("homepage", entry.homepage),
+    ]:
+        if val != "":
+            raw[key] = val
+    return raw
+
+
+@final
+class CompactAcrDb(Mapping[int, CompactAcrEntry]):
+    __slots__ = "__entries"
+
+    def __init__(self, acr_db: ACR_DB_T, /) -> None:
+        entries: list[CompactAcrEntry] = []
+        for acr_id in range(1, len(acr_db) + 1):
+            if (acr_con := acr_db.get(acr_id, None)) is None:
+                raise ValJsonEx(f"missing acr id {acr_id}")
+            entries.append(_create_compact_entry(acr_con))
+        self.__entries = tuple(entries)
+
+    def __getitem__(self, acr_id: int, /) -> CompactAcrEntry:
+        if acr_id not in self:
+            raise KeyError(acr_id)
+        return self.__entries[acr_id - 1]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, len(self.__entries) + 1))
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, acr_id: object, /) -> bool:
+        return isinstance(acr_id, int) and 0 < acr_id <= len(self.__entries)
+
+    def to_entry(self, acr_id: int, /) -> AcrDbEntry:
+        return create_acr_db_entry(_to_raw(self[acr_id]))
+
+    def to_acr_db(self) -> ACR_DB_T:
+        return {acr_id: self.to_entry(acr_id) for acr_id in self}
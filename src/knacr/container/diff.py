@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import Any, final
+
+from knacr.container.acr_db import AcrDbEntry
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldChange:
+    name: str
+    old: Any
+    new: Any
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EntryChange:
+    entry: AcrDbEntry
+    fields: tuple[FieldChange, ...]
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AcrDbDiff:
+    added: dict[int, AcrDbEntry] = field(default_factory=dict)
+    removed: tuple[int, ...] = ()
+    modified: dict[int, EntryChange] = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.added) + len(self.removed) + len(self.modified) == 0
+
+    @property
+    def affected(self) -> set[int]:
+        return {*self.added, *self.removed, *self.modified}
@@ -1,11 +1,12 @@
 from collections import defaultdict
 from re import Pattern
 import re
-from typing import Any, Callable, Final, Sequence, Sized
+from typing import Any, Final, Sequence, Sized
 from knacr.constants.types import ACR_DB_T, ACR_MIN_DB_T, CCNO_DB_T
 
 from knacr.container.acr_db import AcrDbEntry, AcrChaT, CatArgs
 from knacr.container.fun.format import url_to_str
+from knacr.container.fun.template import compile_template
 from knacr.errors.custom_exceptions import ValJsonEx
 from pydantic import HttpUrl
 
@@ -41,22 +42,23 @@ def remove_empty_dict_keys(dict_con: Any, /) -> dict[str, Any]:
     return shallow_copy
 
 
-def _amend_regex_id(acr_db: ACR_DB_T, /) -> ACR_DB_T:
-    for acr_id, acr_con in acr_db.items():
-        if acr_con.regex_id.core == "":
-            buf = remove_empty_dict_keys(acr_con.model_dump())
-            buf.get("regex_id", {})["core"] = acr_con.regex_id.full[1:-1]
-            acr_db[acr_id] = AcrDbEntry(**buf)
-    return acr_db
+def create_acr_db_entry(acr_db_entry: dict[str, Any], /) -> AcrDbEntry:
+    regex_id = acr_db_entry.get("regex_id", None)
+    if (
+        isinstance(regex_id, dict)
+        and "core" not in regex_id
+        and isinstance(full := regex_id.get("full", None), str)
+    ):
+        acr_db_entry = {**acr_db_entry, "regex_id": {**regex_id, "core": full[1:-1]}}
+    return AcrDbEntry(**acr_db_entry)
 
 
 def create_acr_db(to_eval: dict[str, Any], /) -> ACR_DB_T:
-    acr_db = {
-        int(acr_id): AcrDbEntry(**acr_db_entry)
+    return {
+        int(acr_id): create_acr_db_entry(acr_db_entry)
         for acr_id, acr_db_entry in to_eval.items()
         if isinstance(acr_db_entry, dict)
     }
-    return _amend_regex_id(acr_db)
 
 
 def create_acr_min_db(to_eval: dict[str, Any], /) -> ACR_MIN_DB_T:
@@ -74,6 +76,13 @@ def create_acr_min_db(to_eval: dict[str, Any], /) -> ACR_MIN_DB_T:
     return min_db
 
 
+def create_acr_min_projection(to_eval: dict[str, Any], /) -> dict[str, dict[str, Any]]:
+    return {
+        str(acr_id): {"acr": acr, "deprecated": acr_dep} if acr_dep else {"acr": acr}
+        for acr_id, (acr, acr_dep) in create_acr_min_db(to_eval).items()
+    }
+
+
 def create_ccno_db(to_eval: dict[str, Sequence[Any]], /) -> CCNO_DB_T:
     reg_db: CCNO_DB_T = {}
     for acr_id, db_ent in to_eval.items():
@@ -83,18 +92,10 @@ def create_ccno_db(to_eval: dict[str, Sequence[Any]], /) -> CCNO_DB_T:
     return reg_db
 
 
-_CAT_ACR: Final[Pattern[str]] = re.compile(r"\{acr\}")
-_CAT_ID: Final[Pattern[str]] = re.compile(r"\{id\}")
-_CAT_PRE: Final[Pattern[str]] = re.compile(r"\{pre\}")
-_CAT_CORE: Final[Pattern[str]] = re.compile(r"\{core(:\d+)?\}")
-_CAT_CORE_0: Final[Pattern[str]] = re.compile(r"\{core0(:\d+)?\}")
-_CAT_SUF: Final[Pattern[str]] = re.compile(r"\{suf\}")
-_OPT_VAL: Final[Pattern[str]] = re.compile(r"({[^{]+})?<.+?>({.+?})?")
 _VALID_URI: Final[Pattern[str]] = re.compile(r"\{([^}]+?)\}")
 _VALID_PAR: Final[set[str]] = {"acr", "id", "pre", "core", "core0", "suf"}
 _VALID_PAR_SUB: Final[set[str]] = {"core", "core0"}
 _ID_SUB: Final[Pattern[str]] = re.compile(r"^(.+?)(:\d+)?$")
-_ID_SEP: Final[Pattern[str]] = re.compile(r"[^A-Za-z0-9]")
 _LINK: Final[re.Pattern[str]] = re.compile(r"^https?://([^/?]+).*$")
 
 
@@ -131,90 +132,5 @@ def check_uri_template(uris: list[HttpUrl], /) -> None:
         raise ValJsonEx(f"multiple catalogue domains detected [{uris!s}]")
 
 
-def _parse_id_core(mat: str, id_core: str, /) -> dict[str, str]:
-    ids = _ID_SEP.split(id_core)
-    num = _CAT_CORE.match(mat)
-    if num is None:
-        raise ValJsonEx(f"mismatched core id tag: {mat} -> {id_core}")
-    if num.group(1) is None or num.group(1) == "":
-        return {mat: id_core}
-    id_num = int(num.group(1).strip(":"))
-    if id_num > len(ids):
-        return {mat: ""}
-    return {mat: ids[id_num - 1]}
-
-
-def _parse_id_core_0(mat: str, id_core: str, /) -> dict[str, str]:
-    ids = _ID_SEP.split(id_core)
-    num = _CAT_CORE_0.match(mat)
-    if num is None:
-        raise ValJsonEx(f"mismatched core0 id tag: {mat} -> {id_core}")
-    if len(ids) > 1:
-        raise ValJsonEx(
-            f"zero core only available for integer structured ids: {mat} -> {id_core}"
-        )
-    id_num = int(num.group(1).strip(":"))
-    return {mat: "0" * (id_num - len(id_core)) + id_core}
-
-
-_REPL_PARAM: Final[dict[Pattern[str], Callable[[str, CatArgs], dict[str, str]]]] = {
-    _CAT_ACR: lambda mat, cat: {mat: cat.acr},
-    _CAT_ID: lambda mat, cat: {mat: cat.id},
-    _CAT_PRE: lambda mat, cat: {mat: cat.pre},
-    _CAT_CORE: lambda mat, cat: _parse_id_core(mat, cat.core),
-    _CAT_CORE_0: lambda mat, cat: _parse_id_core_0(mat, cat.core),
-    _CAT_SUF: lambda mat, cat: {mat: cat.suf},
-}
-
-
-def _get_repl_param_fun(
-    href_part: str, /
-) -> tuple[str, Callable[[str, CatArgs], dict[str, str]]] | None:
-    for che, repl in _REPL_PARAM.items():
-        if (mat := che.search(href_part)) is not None:
-            return mat.group(0), repl
-    return None
-
-
-def _rm_opt(href: str, left: str, right: str, /) -> str:
-    return re.compile(re.escape(left) + r"<.+?>" + re.escape(right)).sub(
-        f"{left}{right}", href, 1
-    )
-
-
-def _get_left_right(
-    left: str, right: str, args: CatArgs, /
-) -> tuple[dict[str, str], dict[str, str]]:
-    left_f, right_f = _get_repl_param_fun(left), _get_repl_param_fun(right)
-    if left_f is None or right_f is None:
-        raise ValJsonEx(f"uri contains unknown parameter names: {left} - {right}")
-    return left_f[1](left_f[0], args), right_f[1](right_f[0], args)
-
-
-def _are_params_empty(param_con: dict[str, str], /) -> bool:
-    for p_val in param_con.values():
-        if p_val != "":
-            return False
-    return True
-
-
-def _fix_opt(href: str, match: tuple[str, str], args: CatArgs, /) -> str:
-    left, right = match
-    if "" in [left, right]:
-        return _rm_opt(href, left, right)
-    left_p, right_p = _get_left_right(left, right, args)
-    if _are_params_empty(left_p) or _are_params_empty(right_p):
-        return _rm_opt(href, left, right)
-    return re.compile(re.escape(left) + r"<(.+?)>" + re.escape(right)).sub(
-        rf"{left}\g<1>{right}", href, 1
-    )
-
-
 def replace_param_value(href: str, args: CatArgs, /) -> str:
-    for opt in _OPT_VAL.findall(href):
-        href = _fix_opt(href, opt, args)
-    for che, repl in _REPL_PARAM.items():
-        for mat in che.finditer(href):
-            for to_repl, repl_val in repl(mat.group(0), args).items():
-                href = href.replace(to_repl, repl_val)
-    return href
+    return compile_template(href).render(args)
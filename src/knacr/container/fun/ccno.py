@@ -0,0 +1,80 @@
+from functools import lru_cache
+import re
+from re import Pattern
+from typing import Final
+
+from knacr.container.acr_db import AcrCoreReg, AcrDbEntry, CatArgs
+
+type _CORE_REG_T = tuple[
+    Pattern[str], Pattern[str], Pattern[str] | None, Pattern[str] | None
+]
+
+
+_REG_META: Final[frozenset[str]] = frozenset("\\[](){}.*+?^$|")
+_REG_OPT: Final[frozenset[str]] = frozenset("?*{")
+
+
+def _has_top_level_or(regex: str, /) -> bool:
+    depth, in_class, escaped = 0, False, False
+    for char in regex:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+def get_literal_prefix(regex: str, /) -> str:
+    if not regex.startswith("^") or _has_top_level_or(regex):
+        return ""
+    prefix: list[str] = []
+    for char in regex[1:]:
+        if char not in _REG_META:
+            prefix.append(char)
+            continue
+        if char in _REG_OPT and len(prefix) > 0:
+            prefix.pop()
+        break
+    return "".join(prefix)
+
+
+@lru_cache(maxsize=1024)
+def _compile_core_reg(reg: AcrCoreReg, /) -> _CORE_REG_T:
+    return (
+        re.compile(reg.full[1:]),
+        re.compile(rf"^(?P<pre>.*?)(?P<core>{reg.core})(?P<suf>.*)$"),
+        re.compile(reg.pre) if reg.pre != "" else None,
+        re.compile(reg.suf) if reg.suf != "" else None,
+    )
+
+
+def _search_part(reg: Pattern[str] | None, part: str, /) -> str:
+    if reg is None or (mat := reg.search(part)) is None:
+        return ""
+    return mat.group(0)
+
+
+def create_cat_args(ccno: str, acr_con: AcrDbEntry, /) -> CatArgs | None:
+    reg_id, reg_core, reg_pre, reg_suf = _compile_core_reg(acr_con.regex_id)
+    if (id_m := reg_id.search(ccno)) is None:
+        return None
+    ccno_id = id_m.group(0).strip()
+    if (core_m := reg_core.match(ccno_id)) is None:
+        return None
+    return CatArgs(
+        acr=acr_con.acr,
+        id=ccno_id,
+        pre=_search_part(reg_pre, core_m.group("pre")),
+        core=core_m.group("core"),
+        suf=_search_part(reg_suf, core_m.group("suf")),
+    )
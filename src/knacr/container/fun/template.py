@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter
+from re import Match, Pattern
+import re
+from typing import Callable, Final, final
+
+from knacr.container.acr_db import CatArgs
+from knacr.errors.custom_exceptions import ValJsonEx
+
+
+type _RENDER_T = Callable[[CatArgs], str]
+type _PROGRAM_T = tuple[str | _RENDER_T, ...]
+
+_CAT_ACR: Final[Pattern[str]] = re.compile(r"\{acr\}")
+_CAT_ID: Final[Pattern[str]] = re.compile(r"\{id\}")
+_CAT_PRE: Final[Pattern[str]] = re.compile(r"\{pre\}")
+_CAT_CORE: Final[Pattern[str]] = re.compile(r"\{core(:\d+)?\}")
+_CAT_CORE_0: Final[Pattern[str]] = re.compile(r"\{core0(:\d+)?\}")
+_CAT_SUF: Final[Pattern[str]] = re.compile(r"\{suf\}")
+_CAT_PARAM: Final[Pattern[str]] = re.compile(
+    r"\{(?:(acr|id|pre|suf)|(core0?)(?::(\d+))?)\}"
+)
+_CHECK_ORDER: Final[tuple[Pattern[str], ...]] = (
+    _CAT_ACR,
+    _CAT_ID,
+    _CAT_PRE,
+    _CAT_CORE,
+    _CAT_CORE_0,
+    _CAT_SUF,
+)
+_OPT_VAL: Final[Pattern[str]] = re.compile(r"({[^{]+})?<(.+?)>({.+?})?")
+_ID_SEP: Final[Pattern[str]] = re.compile(r"[^A-Za-z0-9]")
+
+
+def _get_core_part(id_num: int, args: CatArgs, /) -> str:
+    ids = _ID_SEP.split(args.core)
+    if id_num > len(ids):
+        return ""
+    return ids[id_num - 1]
+
+
+def _get_core_zero(id_num: int, args: CatArgs, /) -> str:
+    if len(_ID_SEP.split(args.core)) > 1:
+        raise ValJsonEx(
+            f"zero core only available for integer structured ids: {args.core}"
+        )
+    return "0" * (id_num - len(args.core)) + args.core
+
+
+def _create_param(param: Match[str], /) -> _RENDER_T:
+    simple, core, num = param.groups()
+    if simple is not None:
+        return attrgetter(simple)
+    if core == "core" and num is None:
+        return attrgetter("core")
+    if core == "core":
+        return partial(_get_core_part, int(num))
+    if num is None:
+        raise ValJsonEx(f"zero core requires a length: {param.group(0)}")
+    return partial(_get_core_zero, int(num))
+
+
+def _compile_plain(href: str, /) -> list[str | _RENDER_T]:
+    program: list[str | _RENDER_T] = []
+    last = 0
+    for param in _CAT_PARAM.finditer(href):
+        if param.start() > last:
+            program.append(href[last : param.start()])
+        program.append(_create_param(param))
+        last = param.end()
+    if last < len(href):
+        program.append(href[last:])
+    return program
+
+
+def _get_check_param(href_part: str, /) -> _RENDER_T:
+    for che in _CHECK_ORDER:
+        if (mat := che.search(href_part)) is not None and (
+            param := _CAT_PARAM.fullmatch(mat.group(0))
+        ) is not None:
+            return _create_param(param)
+    raise ValJsonEx(f"uri contains unknown parameter names: {href_part}")
+
+
+def _render_opt(
+    left: _RENDER_T, inner: _PROGRAM_T, right: _RENDER_T, args: CatArgs, /
+) -> str:
+    if left(args) == "" or right(args) == "":
+        return ""
+    return _render(inner, args)
+
+
+def _compile_opt(left: str, inner: str, right: str, /) -> list[str | _RENDER_T]:
+    if "" in (left, right):
+        return [*_compile_plain(left), *_compile_plain(right)]
+    opt = partial(
+        _render_opt,
+        _get_check_param(left),
+        tuple(_compile_plain(inner)),
+        _get_check_param(right),
+    )
+    return [*_compile_plain(left), opt, *_compile_plain(right)]
+
+
+def _render(program: _PROGRAM_T, args: CatArgs, /) -> str:
+    return "".join(tok if isinstance(tok, str) else tok(args) for tok in program)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class CatTemplate:
+    href: str
+    program: _PROGRAM_T
+
+    def render(self, args: CatArgs, /) -> str:
+        return _render(self.program, args)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(href: str, /) -> CatTemplate:
+    program: list[str | _RENDER_T] = []
+    last = 0
+    for opt in _OPT_VAL.finditer(href):
+        program.extend(_compile_plain(href[last : opt.start()]))
+        left, inner, right = opt.groups(default="")
+        program.extend(_compile_opt(left, inner, right))
+        last = opt.end()
+    program.extend(_compile_plain(href[last:]))
+    return CatTemplate(href=href, program=tuple(program))
@@ -0,0 +1,65 @@
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import final
+from uuid import UUID
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import AcrDbEntry
+from knacr.container.fun.format import uuid_to_str
+
+
+type _INDEX_T = dict[str, tuple[int, ...]]
+
+
+def _create_index(
+    acr_db: ACR_DB_T, keys: Callable[[AcrDbEntry], Iterable[str]], /
+) -> _INDEX_T:
+    index: dict[str, list[int]] = defaultdict(list)
+    for acr_id, acr_con in sorted(acr_db.items()):
+        for key in keys(acr_con):
+            if key != "" and index[key][-1:] != [acr_id]:
+                index[key].append(acr_id)
+    return {key: tuple(ids) for key, ids in index.items()}
+
+
+@final
+class AcrDbIndex:
+    __slots__ = ("__acr", "__code", "__gbif", "__ror", "__synonym")
+
+    def __init__(self, acr_db: ACR_DB_T, /) -> None:
+        self.__acr = _create_index(acr_db, lambda con: (con.acr,))
+        self.__synonym = _create_index(acr_db, lambda con: con.acr_synonym)
+        self.__code = _create_index(acr_db, lambda con: (con.code,))
+        self.__ror = _create_index(acr_db, lambda con: (con.ror,))
+        self.__gbif = _create_index(acr_db, lambda con: (uuid_to_str(con.gbif),))
+
+    def by_acr(self, acr: str, /) -> tuple[int, ...]:
+        return self.__acr.get(acr, ())
+
+    def by_synonym(self, synonym: str, /) -> tuple[int, ...]:
+        return self.__synonym.get(synonym, ())
+
+    def by_code(self, code: str, /) -> tuple[int, ...]:
+        return self.__code.get(code, ())
+
+    def by_ror(self, ror: str, /) -> tuple[int, ...]:
+        return self.__ror.get(ror, ())
+
+    def by_gbif(self, gbif: UUID | str, /) -> tuple[int, ...]:
+        return self.__gbif.get(str(gbif).lower(), ())
+
+    def by_name(self, acr: str, /) -> tuple[int, ...]:
+        return tuple(sorted({*self.by_acr(acr), *self.by_synonym(acr)}))
+
+    def lookup(self, key: str, /) -> tuple[int, ...]:
+        return tuple(
+            sorted(
+                {
+                    *self.by_acr(key),
+                    *self.by_synonym(key),
+                    *self.by_code(key),
+                    *self.by_ror(key),
+                    *self.by_gbif(key),
+                }
+            )
+        )
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidationIssue:
+    db_name: str
+    check: str
+    acr_id: int | None
+    message: str
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidationReport:
+    issues: list[ValidationIssue] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.issues) == 0
+
+    def by_check(self, check: str, /) -> list[ValidationIssue]:
+        return [issue for issue in self.issues if issue.check == check]
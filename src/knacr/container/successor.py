@@ -0,0 +1,85 @@
+from collections.abc import Iterable, Iterator
+from typing import final
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import AcrChaCon, AcrChaT
+from knacr.errors.custom_exceptions import ValJsonEx
+
+
+type _PATH_T = tuple[AcrChaT, ...]
+type _CLOSURE_T = dict[int, _PATH_T]
+
+
+def _merge_closure(
+    changed_to: list[AcrChaCon], closure: dict[int, _CLOSURE_T], /
+) -> _CLOSURE_T:
+    merged: _CLOSURE_T = {}
+    for cha in changed_to:
+        reachable: list[tuple[int, _PATH_T]] = [(cha.id, ()), *closure[cha.id].items()]
+        for next_id, path in reachable:
+            full_path = (cha.type, *path)
+            if next_id not in merged or len(full_path) < len(merged[next_id]):
+                merged[next_id] = full_path
+    return merged
+
+
+def _create_closure(acr_db: ACR_DB_T, roots: Iterable[int], /) -> dict[int, _CLOSURE_T]:
+    closure: dict[int, _CLOSURE_T] = {}
+    for root in sorted(roots):
+        if root in closure:
+            continue
+        stack: list[tuple[int, Iterator[AcrChaCon]]] = [
+            (root, iter(acr_db[root].acr_changed_to))
+        ]
+        on_path = {root}
+        while len(stack) > 0:
+            cur_id, changed_to = stack[-1]
+            if (cha := next(changed_to, None)) is None:
+                closure[cur_id] = _merge_closure(acr_db[cur_id].acr_changed_to, closure)
+                on_path.remove(cur_id)
+                stack.pop()
+            elif cha.id not in acr_db:
+                raise ValJsonEx(
+                    f"missing changed to id {cha.id} for acronym {acr_db[cur_id].acr}"
+                )
+            elif cha.id in on_path:
+                path = [acr_id for acr_id, _ in stack]
+                raise ValJsonEx(f"loop detected in {path} for {acr_db[cur_id].acr}")
+            elif cha.id not in closure:
+                on_path.add(cha.id)
+                stack.append((cha.id, iter(acr_db[cha.id].acr_changed_to)))
+    return closure
+
+
+def check_changed_to_graph(acr_db: ACR_DB_T, roots: Iterable[int], /) -> None:
+    _create_closure(acr_db, roots)
+
+
+@final
+class AcrSuccessors:
+    __slots__ = ("__closure", "__current")
+
+    def __init__(self, acr_db: ACR_DB_T, /) -> None:
+        closure = _create_closure(acr_db, acr_db)
+        self.__closure: dict[int, tuple[tuple[int, _PATH_T], ...]] = {
+            acr_id: tuple(sorted(reach.items())) for acr_id, reach in closure.items()
+        }
+        self.__current: dict[int, tuple[int, ...]] = {}
+        for acr_id, reach in closure.items():
+            if acr_db[acr_id].active:
+                self.__current[acr_id] = (acr_id,)
+            else:
+                self.__current[acr_id] = tuple(
+                    sorted(
+                        next_id
+                        for next_id in reach
+                        if acr_db[next_id].active
+                        and len(acr_db[next_id].acr_changed_to) == 0
+                    )
+                )
+
+    def successors(self, acr_id: int, /) -> tuple[tuple[int, _PATH_T], ...]:
+        return self.__closure.get(acr_id, ())
+
+    def current(self, acr_id: int, /) -> tuple[int, ...]:
+        return self.__current.get(acr_id, ())
@@ -0,0 +1,143 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+import csv
+import io
+from itertools import islice
+import json
+from typing import Any, Callable, Final, TextIO
+
+from knacr.container.links import LinkLevel
+from knacr.library.loader import load_all
+from knacr.library.resolver import CCNoResolver
+
+
+type _FORMAT_T = Callable[[CCNoResolver, int, list[str], tuple[LinkLevel, ...]], str]
+
+CSV_HEADER: Final[tuple[str, ...]] = (
+    "line",
+    "ccno",
+    "id",
+    "acr",
+    "level",
+    "catalogue",
+    "homepage",
+)
+_CHUNK_SIZE: Final[int] = 1000
+_WINDOW_PER_WORKER: Final[int] = 4
+
+
+def _format_jsonl(
+    resolver: CCNoResolver,
+    _start: int,
+    ccnos: list[str],
+    exclude: tuple[LinkLevel, ...],
+    /,
+) -> str:
+    return "".join(
+        json.dumps(resolver.links(ccno, exclude), ensure_ascii=False) + "\n"
+        for ccno in ccnos
+    )
+
+
+def _format_csv(
+    resolver: CCNoResolver,
+    start: int,
+    ccnos: list[str],
+    exclude: tuple[LinkLevel, ...],
+    /,
+) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for line, ccno in enumerate(ccnos, start):
+        links: list[dict[str, Any]] = resolver.links(ccno, exclude)["links"]
+        if len(links) == 0:
+            writer.writerow((line, ccno, "", "", LinkLevel.emp.value, "", ""))
+        for link in links:
+            writer.writerow(
+                (
+                    line,
+                    ccno,
+                    link["id"],
+                    link["acr"],
+                    link["level"],
+                    " ".join(link["catalogue"]),
+                    link["homepage"],
+                )
+            )
+    return out.getvalue()
+
+
+_FORMATS: Final[dict[str, _FORMAT_T]] = {"jsonl": _format_jsonl, "csv": _format_csv}
+_WORKER: dict[str, CCNoResolver] = {}
+
+
+def _init_worker(version: str, /) -> None:
+    _WORKER["resolver"] = CCNoResolver(load_all(version))
+
+
+def _run_worker(
+    fmt: str, start: int, ccnos: list[str], exclude: tuple[LinkLevel, ...], /
+) -> str:
+    return _FORMATS[fmt](_WORKER["resolver"], start, ccnos, exclude)
+
+
+def _chunk(lines: Iterable[str], size: int, /) -> Iterator[tuple[int, list[str]]]:
+    ccnos = (line.strip() for line in lines)
+    start = 1
+    while len(chunk := list(islice(ccnos, size))) > 0:
+        yield start, chunk
+        start += len(chunk)
+
+
+def _run_pool(
+    chunks: Iterator[tuple[int, list[str]]],
+    fmt: str,
+    exclude: tuple[LinkLevel, ...],
+    version: str,
+    workers: int,
+    /,
+) -> Iterator[str]:
+    window: deque[Future[str]] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(version,)
+    ) as pool:
+        for start, chunk in chunks:
+            window.append(pool.submit(_run_worker, fmt, start, chunk, exclude))
+            if len(window) >= workers * _WINDOW_PER_WORKER:
+                yield window.popleft().result()
+        while len(window) > 0:
+            yield window.popleft().result()
+
+
+def resolve_batch(
+    lines: Iterable[str],
+    fmt: str,
+    exclude: tuple[LinkLevel, ...],
+    version: str,
+    workers: int = 1,
+    chunk_size: int = _CHUNK_SIZE,
+    /,
+) -> Iterator[str]:
+    chunks = _chunk(lines, chunk_size)
+    if workers > 1:
+        yield from _run_pool(chunks, fmt, exclude, version, workers)
+        return
+    resolver = CCNoResolver(load_all(version))
+    for start, chunk in chunks:
+        yield _FORMATS[fmt](resolver, start, chunk, exclude)
+
+
+def write_batch(
+    lines: Iterable[str],
+    out: TextIO,
+    fmt: str,
+    exclude: tuple[LinkLevel, ...],
+    version: str,
+    workers: int = 1,
+    /,
+) -> None:
+    if fmt == "csv":
+        csv.writer(out, lineterminator="\n").writerow(CSV_HEADER)
+    for block in resolve_batch(lines, fmt, exclude, version, workers):
+        out.write(block)
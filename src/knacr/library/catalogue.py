@@ -1,14 +1,35 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import time
+from typing import final
+from knacr.constants.types import ACR_DB_T
 from knacr.container.acr_db import AcrDbEntry, CatArgs
-from knacr.container.fun.acr_db import replace_param_value
+from knacr.container.fun.template import CatTemplate, compile_template
 from knacr.container.links import CatalogueLink, LinkLevel
 
 from knacr.container.fun.acr_db import url_to_str
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.metrics import emit_metric, get_metric_hook, measure
+
+
+def _compile_catalogue(acr_db: AcrDbEntry, /) -> tuple[CatTemplate, ...]:
+    return tuple(compile_template(url_to_str(cat)) for cat in acr_db.catalogue)
+
+
+def _render(cat: CatTemplate, args: CatArgs, /) -> str:
+    if get_metric_hook() is None:
+        return cat.render(args)
+    with measure("template_render"):
+        return cat.render(args)
+
+
+def render_template(href: str, args: CatArgs, /) -> str:
+    return _render(compile_template(href), args)
 
 
 def create_catalogue_link(acr_db: AcrDbEntry, args: CatArgs, /) -> Iterable[str]:
-    for cat in acr_db.catalogue:
-        yield replace_param_value(url_to_str(cat), args)
+    for cat in _compile_catalogue(acr_db):
+        yield _render(cat, args)
 
 
 def _create_link_level(cat_link: list[str], hom_link: str, /) -> LinkLevel:
@@ -22,20 +43,79 @@ def _create_link_level(cat_link: list[str], hom_link: str, /) -> LinkLevel:
     return level
 
 
-def create_ccno_links(
-    acr_db: AcrDbEntry, args: CatArgs, exclude: tuple[LinkLevel, ...] = (), /
-) -> CatalogueLink:
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _LinkPlan:
+    level: LinkLevel
+    catalogue: tuple[CatTemplate, ...] = ()
+    homepage: str = ""
+
+    def create(self, args: CatArgs, /) -> CatalogueLink:
+        return CatalogueLink(
+            level=self.level,
+            catalogue=[_render(cat, args) for cat in self.catalogue],
+            homepage=self.homepage,
+        )
+
+
+def _create_link_plan(acr_db: AcrDbEntry, exclude: tuple[LinkLevel, ...], /) -> _LinkPlan:
     if not acr_db.active or acr_db.deprecated:
-        return CatalogueLink(level=LinkLevel.emp)
-    cat_link, hom_link = [], ""
+        return _LinkPlan(level=LinkLevel.emp)
+    cat_link: tuple[CatTemplate, ...] = ()
+    hom_link = ""
     if LinkLevel.cat not in exclude:
-        cat_link = [
-            replace_param_value(url_to_str(cat), args) for cat in acr_db.catalogue
-        ]
+        cat_link = _compile_catalogue(acr_db)
     if LinkLevel.home not in exclude:
         hom_link = url_to_str(acr_db.homepage)
-    return CatalogueLink(
-        level=_create_link_level(cat_link, hom_link),
+    return _LinkPlan(
+        level=_create_link_level([cat.href for cat in cat_link], hom_link),
         catalogue=cat_link,
         homepage=hom_link,
     )
+
+
+def create_ccno_links(
+    acr_db: AcrDbEntry, args: CatArgs, exclude: tuple[LinkLevel, ...] = (), /
+) -> CatalogueLink:
+    if get_metric_hook() is None:
+        return _create_link_plan(acr_db, exclude).create(args)
+    start = time.perf_counter()
+    plan = _create_link_plan(acr_db, exclude)
+    link = plan.create(args)
+    emit_metric("link_render", time.perf_counter() - start, len(plan.catalogue))
+    return link
+
+
+def stream_ccno_links(
+    acr_db: ACR_DB_T,
+    ccnos: Iterable[tuple[int, CatArgs]],
+    exclude: tuple[LinkLevel, ...] = (),
+    /,
+) -> Iterator[CatalogueLink]:
+    plans: dict[int, _LinkPlan] = {}
+    timed = get_metric_hook() is not None
+    renders, spent = 0, 0.0
+    try:
+        for acr_id, args in ccnos:
+            start = time.perf_counter() if timed else 0.0
+            if (plan := plans.get(acr_id, None)) is None:
+                if (acr_con := acr_db.get(acr_id, None)) is None:
+                    raise ValJsonEx(f"unknown acr id {acr_id}")
+                plan = plans[acr_id] = _create_link_plan(acr_con, exclude)
+            link = plan.create(args)
+            if timed:
+                renders += len(plan.catalogue)
+                spent += time.perf_counter() - start
+            yield link
+    finally:
+        if timed:
+            emit_metric("link_render", spent, renders)
+
+
+def create_bulk_ccno_links(
+    acr_db: ACR_DB_T,
+    ccnos: Iterable[tuple[int, CatArgs]],
+    exclude: tuple[LinkLevel, ...] = (),
+    /,
+) -> list[CatalogueLink]:
+    return list(stream_ccno_links(acr_db, ccnos, exclude))
@@ -0,0 +1,187 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import re
+import threading
+from typing import Any, Final, final
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import CatArgs
+from knacr.container.fun.ccno import create_cat_args, get_literal_prefix
+
+
+@final
+class CCNoIdentifier:
+    __slots__ = ("__dispatch", "__fallback", "__regex")
+
+    def __init__(self, acr_db: ACR_DB_T, /) -> None:
+        self.__regex: dict[int, re.Pattern[str]] = {}
+        by_len: dict[int, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+        fallback: list[int] = []
+        for acr_id, acr_con in acr_db.items():
+            self.__regex[acr_id] = re.compile(acr_con.regex_ccno)
+            if (prefix := get_literal_prefix(acr_con.regex_ccno)) == "":
+                fallback.append(acr_id)
+            else:
+                by_len[len(prefix)][prefix].append(acr_id)
+        self.__fallback: tuple[int, ...] = tuple(sorted(fallback))
+        self.__dispatch: tuple[tuple[int, dict[str, tuple[int, ...]]], ...] = tuple(
+            (pre_len, {pre: tuple(ids) for pre, ids in pre_ids.items()})
+            for pre_len, pre_ids in sorted(by_len.items())
+        )
+
+    def candidates(self, ccno: str, /) -> tuple[int, ...]:
+        found: tuple[int, ...] = self.__fallback
+        for pre_len, pre_ids in self.__dispatch:
+            if len(ccno) < pre_len:
+                break
+            if (ids := pre_ids.get(ccno[:pre_len], None)) is not None:
+                found += ids
+        return found
+
+    def identify(self, ccno: str, /) -> list[int]:
+        return sorted(
+            acr_id
+            for acr_id in self.candidates(ccno)
+            if self.__regex[acr_id].match(ccno) is not None
+        )
+
+
+def parse_ccnos(
+    ccnos: Iterable[str], acr_db: ACR_DB_T, /
+) -> Iterator[tuple[int, CatArgs]]:
+    identifier = CCNoIdentifier(acr_db)
+    for ccno in ccnos:
+        for acr_id in identifier.identify(ccno):
+            if (args := create_cat_args(ccno, acr_db[acr_id])) is not None:
+                yield acr_id, args
+
+
+type _NORM_T = tuple[int, str, CatArgs]
+
+_SEP: Final[str] = " \t\r\n-_:./"
+_TRIE_END: Final[str] = ""
+
+
+def _normalize_key(name: str, /) -> str:
+    return "".join(char for char in name.upper() if char not in _SEP)
+
+
+def _create_variants(prefix: str, rest: str, /) -> list[str]:
+    rests = [rest] if rest.upper() == rest else [rest, rest.upper()]
+    return list(
+        dict.fromkeys(f"{prefix}{sep}{var}" for var in rests for sep in (" ", "", "-"))
+    )
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CCNoNormStats:
+    exact: int = 0
+    normalized: int = 0
+    unmatched: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.exact + self.normalized + self.unmatched
+
+
+@final
+class CCNoNormalizer:
+    __slots__ = (
+        "__acr_db",
+        "__counts",
+        "__identifier",
+        "__lock",
+        "__prefix",
+        "__regex",
+        "__trie",
+    )
+
+    def __init__(self, acr_db: ACR_DB_T, /) -> None:
+        self.__acr_db = acr_db
+        self.__identifier = CCNoIdentifier(acr_db)
+        self.__lock = threading.Lock()
+        self.__counts = [0, 0, 0]
+        self.__regex: dict[int, re.Pattern[str]] = {}
+        self.__prefix: dict[int, str] = {}
+        self.__trie: dict[str, Any] = {}
+        for acr_id, acr_con in sorted(acr_db.items()):
+            self.__regex[acr_id] = re.compile(acr_con.regex_ccno)
+            prefix = get_literal_prefix(acr_con.regex_ccno)
+            self.__prefix[acr_id] = acr_con.acr if prefix == "" else prefix
+            for name in {prefix, acr_con.acr, *acr_con.acr_synonym}:
+                if (key := _normalize_key(name)) != "":
+                    self.__add_key(key, acr_id)
+
+    def __add_key(self, key: str, acr_id: int, /) -> None:
+        node = self.__trie
+        for char in key:
+            node = node.setdefault(char, {})
+        ids: tuple[int, ...] = node.get(_TRIE_END, ())
+        if acr_id not in ids:
+            node[_TRIE_END] = (*ids, acr_id)
+
+    def __walk(self, ccno: str, /) -> list[tuple[int, tuple[int, ...]]]:
+        node, hits = self.__trie, []
+        for pos, char in enumerate(ccno):
+            if char in _SEP:
+                continue
+            if (child := node.get(char.upper(), None)) is None:
+                break
+            node = child
+            if (ids := node.get(_TRIE_END, None)) is not None:
+                hits.append((pos + 1, ids))
+        return hits
+
+    def __canonical(self, acr_id: int, ccno: str, args: CatArgs, /) -> _NORM_T:
+        canonical = f"{self.__prefix[acr_id]} {args.id}"
+        if canonical == ccno or self.__regex[acr_id].match(canonical) is None:
+            return acr_id, ccno, args
+        return acr_id, canonical, args
+
+    def __match(self, acr_id: int, rest: str, /) -> _NORM_T | None:
+        for ccno in _create_variants(self.__prefix[acr_id], rest):
+            if self.__regex[acr_id].match(ccno) is None:
+                continue
+            if (args := create_cat_args(ccno, self.__acr_db[acr_id])) is not None:
+                return self.__canonical(acr_id, ccno, args)
+        return None
+
+    def __normalize(self, ccno: str, /) -> tuple[_NORM_T, ...]:
+        for end, ids in reversed(self.__walk(ccno)):
+            if (rest := ccno[end:].lstrip(_SEP)) == "":
+                continue
+            matches = (self.__match(acr_id, rest) for acr_id in ids)
+            if len(found := tuple(norm for norm in matches if norm is not None)) > 0:
+                return found
+        return ()
+
+    def __count(self, pos: int, /) -> None:
+        with self.__lock:
+            self.__counts[pos] += 1
+
+    def normalize(self, ccno: str, /) -> tuple[_NORM_T, ...]:
+        exact = tuple(
+            self.__canonical(acr_id, ccno, args)
+            for acr_id in self.__identifier.identify(ccno)
+            if (args := create_cat_args(ccno, self.__acr_db[acr_id])) is not None
+        )
+        if len(exact) > 0:
+            self.__count(0)
+            return exact
+        found = self.__normalize(ccno.strip())
+        self.__count(1 if len(found) > 0 else 2)
+        return found
+
+    @property
+    def stats(self) -> CCNoNormStats:
+        with self.__lock:
+            exact, normalized, unmatched = self.__counts
+        return CCNoNormStats(exact=exact, normalized=normalized, unmatched=unmatched)
+
+    def reset_stats(self) -> CCNoNormStats:
+        with self.__lock:
+            exact, normalized, unmatched = self.__counts
+            self.__counts = [0, 0, 0]
+        return CCNoNormStats(exact=exact, normalized=normalized, unmatched=unmatched)
@@ -0,0 +1,95 @@
+from typing import Any
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import AcrDbEntry
+from knacr.container.diff import AcrDbDiff, EntryChange, FieldChange
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.validate import (
+    check_acr_db_update,
+    validate_acr_db_entry,
+    validate_acr_db_keys,
+)
+
+
+def _diff_fields(old: AcrDbEntry, new: AcrDbEntry, /) -> tuple[FieldChange, ...]:
+    return tuple(
+        FieldChange(name=name, old=getattr(old, name), new=getattr(new, name))
+        for name in AcrDbEntry.model_fields
+        if getattr(old, name) != getattr(new, name)
+    )
+
+
+def _create_diff(
+    added: set[int],
+    removed: set[int],
+    new_db: ACR_DB_T,
+    old_db: ACR_DB_T,
+    changed: set[int],
+    /,
+) -> AcrDbDiff:
+    modified: dict[int, EntryChange] = {}
+    for acr_id in sorted(changed):
+        if len(fields := _diff_fields(old_db[acr_id], new_db[acr_id])) > 0:
+            modified[acr_id] = EntryChange(entry=new_db[acr_id], fields=fields)
+    return AcrDbDiff(
+        added={acr_id: new_db[acr_id] for acr_id in sorted(added)},
+        removed=tuple(sorted(removed)),
+        modified=modified,
+    )
+
+
+def diff_acr_db(old_db: ACR_DB_T, new_db: ACR_DB_T, /) -> AcrDbDiff:
+    changed = {
+        acr_id
+        for acr_id in old_db.keys() & new_db.keys()
+        if old_db[acr_id] != new_db[acr_id]
+    }
+    return _create_diff(
+        new_db.keys() - old_db.keys(),
+        old_db.keys() - new_db.keys(),
+        new_db,
+        old_db,
+        changed,
+    )
+
+
+def _to_ids(to_eval: dict[str, Any], /) -> dict[int, Any]:
+    validate_acr_db_keys(to_eval)
+    return {int(acr_id): acr_db_entry for acr_id, acr_db_entry in to_eval.items()}
+
+
+def diff_raw_acr_db(old_raw: dict[str, Any], new_raw: dict[str, Any], /) -> AcrDbDiff:
+    old_ids, new_ids = _to_ids(old_raw), _to_ids(new_raw)
+    touched = {
+        acr_id
+        for acr_id, raw in new_ids.items()
+        if acr_id not in old_ids or old_ids[acr_id] != raw
+    }
+    new_db = {
+        acr_id: validate_acr_db_entry(acr_id, new_ids[acr_id]) for acr_id in touched
+    }
+    changed = touched & old_ids.keys()
+    old_db = {
+        acr_id: validate_acr_db_entry(acr_id, old_ids[acr_id]) for acr_id in changed
+    }
+    return _create_diff(
+        touched - old_ids.keys(), old_ids.keys() - new_ids.keys(), new_db, old_db, changed
+    )
+
+
+def apply_acr_db_diff(acr_db: ACR_DB_T, diff: AcrDbDiff, /) -> ACR_DB_T:
+    for acr_id in diff.added:
+        if acr_id in acr_db:
+            raise ValJsonEx(f"added acr id {acr_id} already exists")
+    for acr_id in (*diff.removed, *diff.modified):
+        if acr_id not in acr_db:
+            raise ValJsonEx(f"changed acr id {acr_id} does not exist")
+    removed = set(diff.removed)
+    updated = {
+        acr_id: acr_con for acr_id, acr_con in acr_db.items() if acr_id not in removed
+    }
+    updated.update((acr_id, change.entry) for acr_id, change in diff.modified.items())
+    if len(diff.added) > 0:
+        updated = dict(sorted([*updated.items(), *diff.added.items()]))
+    check_acr_db_update(updated, diff.affected)
+    return updated
@@ -0,0 +1,167 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import re
+from typing import Any, Final, final
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from knacr.errors.custom_exceptions import ReqURIEx
+from knacr.library.metrics import measure
+from knacr.library.paths import get_default_cache_dir
+
+
+_KNACR_RAW: Final[str] = "https://raw.githubusercontent.com/LeibnizDSMZ/knAcr"
+_IMMUTABLE_VER: Final[re.Pattern[str]] = re.compile(r"^v\d+\.\d+\.\d+$")
+_RESERVED_KEYS: Final[frozenset[str]] = frozenset(("", ".", ".."))
+_TIMEOUT: Final[int] = 60
+_POOL_SIZE: Final[int] = 8
+
+
+def create_data_url(version: str, db_name: str, /) -> str:
+    return f"{_KNACR_RAW}/{version}/src/knacr/data/{db_name}.json"
+
+
+def is_immutable_version(version: str, /) -> bool:
+    return _IMMUTABLE_VER.match(version) is not None
+
+
+def _create_cache_key(version: str, /) -> str:
+    if version in _RESERVED_KEYS:
+        raise ReqURIEx(f"invalid data version {version!r}")
+    return quote(version, safe="")
+
+
+def create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get(
+    url: str, headers: dict[str, str], session: requests.Session | None, /
+) -> requests.Response:
+    if session is None:
+        return requests.get(url, headers=headers, timeout=_TIMEOUT)
+    return session.get(url, headers=headers, timeout=_TIMEOUT)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheEntry:
+    body: bytes
+    etag: str = ""
+    last_modified: str = ""
+
+
+def _get_header(headers: Mapping[str, Any], name: str, /) -> str:
+    value = headers.get(name, "")
+    return value if isinstance(value, str) else ""
+
+
+@final
+class DownloadCache:
+    __slots__ = "__root"
+
+    def __init__(self, root: Path | None = None, /) -> None:
+        self.__root = get_default_cache_dir() if root is None else root
+
+    @property
+    def root(self) -> Path:
+        return self.__root
+
+    def _get_paths(self, version: str, db_name: str, /) -> tuple[Path, Path]:
+        ver_dir = self.__root / "data" / _create_cache_key(version)
+        return ver_dir / f"{db_name}.json", ver_dir / f"{db_name}.meta.json"
+
+    def load(self, version: str, db_name: str, /) -> CacheEntry | None:
+        body, meta = self._get_paths(version, db_name)
+        try:
+            headers = json.loads(meta.read_bytes())
+            if not isinstance(headers, dict):
+                return None
+            return CacheEntry(
+                body=body.read_bytes(),
+                etag=_get_header(headers, "etag"),
+                last_modified=_get_header(headers, "last_modified"),
+            )
+        except (OSError, ValueError):
+            return None
+
+    def store(self, version: str, db_name: str, entry: CacheEntry, /) -> None:
+        body, meta = self._get_paths(version, db_name)
+        headers = {"etag": entry.etag, "last_modified": entry.last_modified}
+        try:
+            body.parent.mkdir(parents=True, exist_ok=True)
+            for path, con in [(body, entry.body), (meta, json.dumps(headers).encode())]:
+                tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(con)
+                tmp.replace(path)
+        except OSError:
+            return
+
+    def fetch(
+        self,
+        url: str,
+        version: str,
+        db_name: str,
+        session: requests.Session | None = None,
+        /,
+    ) -> bytes:
+        cached = self.load(version, db_name)
+        if cached is not None and is_immutable_version(version):
+            return cached.body
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag != "":
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified != "":
+            headers["If-Modified-Since"] = cached.last_modified
+        res = _get(url, headers, session)
+        if cached is not None and res.status_code == 304:
+            return cached.body
+        if not res.ok:
+            raise ReqURIEx(f"Could not get {url}")
+        self.store(
+            version,
+            db_name,
+            CacheEntry(
+                body=res.content,
+                etag=_get_header(res.headers, "ETag"),
+                last_modified=_get_header(res.headers, "Last-Modified"),
+            ),
+        )
+        return res.content
+
+
+_CACHE: DownloadCache | None = DownloadCache()
+
+
+def get_download_cache() -> DownloadCache | None:
+    return _CACHE
+
+
+def set_download_cache(cache: DownloadCache | None, /) -> None:
+    global _CACHE
+    _CACHE = cache
+
+
+def download_data(
+    version: str, db_name: str, session: requests.Session | None = None, /
+) -> bytes:
+    url = create_data_url(version, db_name)
+    with measure("download", version=version, db_name=db_name) as mes:
+        if (cache := get_download_cache()) is not None:
+            body = cache.fetch(url, version, db_name, session)
+        else:
+            res = _get(url, {}, session)
+            if not res.ok:
+                raise ReqURIEx(f"Could not get {url}")
+            body = res.content
+        mes.size = len(body)
+    return body
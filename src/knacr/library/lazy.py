@@ -0,0 +1,50 @@
+from collections.abc import Iterator, Mapping
+from typing import Any, final
+
+from knacr.constants.types import ACR_DB_T
+from knacr.container.acr_db import AcrDbEntry
+from knacr.library.validate import (
+    check_acr_db,
+    validate_acr_db_entry,
+    validate_acr_db_keys,
+)
+
+
+@final
+class LazyAcrDb(Mapping[int, AcrDbEntry]):
+    __slots__ = ("__entries", "__raw")
+
+    def __init__(self, to_eval: dict[str, Any], /) -> None:
+        validate_acr_db_keys(to_eval)
+        self.__raw: dict[int, Any] = {
+            int(acr_id): acr_db_entry for acr_id, acr_db_entry in to_eval.items()
+        }
+        self.__entries: dict[int, AcrDbEntry] = {}
+
+    def __getitem__(self, acr_id: int, /) -> AcrDbEntry:
+        if (acr_con := self.__entries.get(acr_id, None)) is not None:
+            return acr_con
+        acr_con = validate_acr_db_entry(acr_id, self.__raw[acr_id])
+        self.__entries[acr_id] = acr_con
+        return acr_con
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__raw)
+
+    def __len__(self) -> int:
+        return len(self.__raw)
+
+    def __contains__(self, acr_id: object, /) -> bool:
+        return acr_id in self.__raw
+
+    @property
+    def materialized(self) -> int:
+        return len(self.__entries)
+
+    def materialize(self) -> ACR_DB_T:
+        return {acr_id: self[acr_id] for acr_id in self.__raw}
+
+    def validate(self) -> ACR_DB_T:
+        acr_db = self.materialize()
+        check_acr_db(acr_db)
+        return acr_db
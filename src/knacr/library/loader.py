@@ -1,15 +1,26 @@
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
 import json
-from typing import Any, Callable
+import logging
+from pathlib import Path
+from typing import Any, Callable, Final
 import warnings
 
-import requests
 from knacr.constants.types import ACR_DB_T, ACR_MIN_DB_T, CCNO_DB_T
 from knacr.constants.versions import CURRENT_VER
-from knacr.container.fun.acr_db import create_acr_min_db
+from knacr.container.bundle import DbBundle
+from knacr.container.index import AcrDbIndex
+from knacr.container.report import ValidationReport
+from knacr.container.successor import AcrSuccessors
+from knacr.container.fun.acr_db import create_acr_min_db, create_acr_min_projection
 from knacr.errors.custom_exceptions import ReqURIEx, ValJsonEx
 from knacr.errors.custom_warnings import LoadWarn
+from knacr.library.lazy import LazyAcrDb
+from knacr.library.metrics import measure
+from knacr.library.snapshot import SnapshotStore, get_snapshot_store
 from knacr.library.validate import (
+    create_validation_report,
     validate_acr_db,
     validate_catalogue_db,
     validate_min_acr_db_schema,
@@ -18,29 +29,81 @@ from knacr.library.validate import (
 from knacr import data
 
 
+_DB_NAMES: Final[tuple[str, str, str]] = ("acr_db", "regex_db", "catalogue_db")
+_MIN_DB_NAME: Final[str] = "acr_min_db"
+_LOG: Final[logging.Logger] = logging.getLogger(__name__)
+
+
 def _load_data_from_file(db_name: str, /) -> bytes:
     with resources.files(data).joinpath(f"{db_name}.json").open("rb") as fhd:
         return fhd.read()
 
 
+def _load_raw_data(version: str, db_name: str, /) -> bytes:
+    if version == CURRENT_VER:
+        _LOG.info("loading %s from local file", db_name)
+        return _load_data_from_file(db_name)
+    from knacr.library.download import download_data
+
+    _LOG.info("downloading %s %s from github collection", db_name, version)
+    return download_data(version, db_name)
+
+
+def _load_min_raw_data(version: str, /) -> bytes:
+    if version == CURRENT_VER:
+        _LOG.info("loading %s from local file", _MIN_DB_NAME)
+        return _load_data_from_file(_MIN_DB_NAME)
+    from knacr.library.download import download_data
+
+    try:
+        return download_data(version, _MIN_DB_NAME)
+    except ReqURIEx:
+        _LOG.info("no %s for %s, using the full acr_db", _MIN_DB_NAME, version)
+    return _load_raw_data(version, "acr_db")
+
+
+def _decode(raw: bytes, db_name: str, /) -> Any:
+    with measure("json_decode", db_name=db_name) as mes:
+        mes.size = len(raw)
+        try:
+            return json.loads(raw)
+        except ValueError as exc:
+            raise ValJsonEx(f"{db_name} is not valid JSON: {exc}") from exc
+
+
 def _load_data[
     T: (ACR_DB_T, ACR_MIN_DB_T, CCNO_DB_T)
 ](version: str, db_name: str, create: Callable[[Any], T], /) -> T:
-    knacr = "https://raw.githubusercontent.com/LeibnizDSMZ/knAcr"
-    req = f"{knacr}/{version}/src/knacr/data/{db_name}.json"
-    if version == CURRENT_VER:
-        print("[KnAcr] loading from local file")
-        return create(json.loads(_load_data_from_file(db_name)))
-    print("[KnAcr] downloading from github collection")
-    if (res := requests.get(req, timeout=60)).ok:
-        con = res.json()
-        return create(con)
-    else:
-        raise ReqURIEx(f"Could not get {req}")
+    return create(_decode(_load_raw_data(version, db_name), db_name))
+
+
+def _parse_acr_db_snapshot(raw: bytes, /) -> ACR_DB_T:
+    if (store := get_snapshot_store()) is None:
+        return parse_acr_db(_decode(raw, "acr_db"))
+    with measure("snapshot_load", db_name="acr_db"):
+        acr_db = store.load(raw)
+    if acr_db is not None:
+        return acr_db
+    acr_db = parse_acr_db(_decode(raw, "acr_db"))
+    store.store(raw, acr_db)
+    return acr_db
+
+
+def create_current_min_projection(path: Path, /) -> Path:
+    projection = create_acr_min_projection(
+        _dict_guard(json.loads(_load_data_from_file("acr_db")))
+    )
+    path.write_text(json.dumps(projection, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def create_current_snapshot(root: Path | None = None, /) -> Path | None:
+    raw = _load_data_from_file("acr_db")
+    return SnapshotStore(root).store(raw, parse_acr_db(json.loads(raw)))
 
 
 def _catch_expected_err[
-    **P, T: (ACR_DB_T, ACR_MIN_DB_T, CCNO_DB_T)
+    **P, T: (ACR_DB_T, ACR_MIN_DB_T, CCNO_DB_T, DbBundle, LazyAcrDb)
 ](loader: Callable[P, T]) -> Callable[P, T]:
     def load_f(*args: P.args, **kwargs: P.kwargs) -> T:
         version = CURRENT_VER
@@ -63,14 +126,44 @@ def _catch_expected_err[
     return load_f
 
 
+def _get_version(args: tuple[Any, ...], /) -> str:
+    for arg in args[:2]:
+        if isinstance(arg, str):
+            return arg
+    return CURRENT_VER
+
+
+def _catch_expected_err_async[
+    **P, T: (ACR_DB_T, CCNO_DB_T, DbBundle)
+](loader: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Coroutine[Any, Any, T]]:
+    async def load_f(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return await loader(*args, **kwargs)
+        except (ReqURIEx, ValJsonEx):
+            warnings.warn(
+                f"Could not load version: {_get_version(args)}", LoadWarn, stacklevel=2
+            )
+        return await loader(
+            *tuple(CURRENT_VER if isinstance(arg, str) else arg for arg in args),  # type: ignore
+            **kwargs,
+        )
+
+    return load_f
+
+
 @_catch_expected_err
 def load_acr_db(version: str = CURRENT_VER, /) -> ACR_DB_T:
-    return _load_data(version, "acr_db", parse_acr_db)
+    return _parse_acr_db_snapshot(_load_raw_data(version, "acr_db"))
+
+
+@_catch_expected_err
+def load_lazy_acr_db(version: str = CURRENT_VER, /) -> LazyAcrDb:
+    return LazyAcrDb(_dict_guard(_decode(_load_raw_data(version, "acr_db"), "acr_db")))
 
 
 @_catch_expected_err
 def load_min_acr_db(version: str = CURRENT_VER, /) -> ACR_MIN_DB_T:
-    return _load_data(version, "acr_db", parse_min_acr_db)
+    return parse_min_acr_db(_decode(_load_min_raw_data(version), _MIN_DB_NAME))
 
 
 @_catch_expected_err
@@ -87,6 +180,92 @@ def load_catalogue_db(acr_db: ACR_DB_T, version: str = CURRENT_VER, /) -> CCNO_D
     )
 
 
+def load_all_raw(version: str, /) -> list[bytes]:
+    if version == CURRENT_VER:
+        _LOG.info("loading all databases from local file")
+        return [_load_data_from_file(db_name) for db_name in _DB_NAMES]
+    from knacr.library.download import create_session, download_data
+
+    _LOG.info("downloading all databases %s from github collection", version)
+    session = create_session()
+    try:
+        with ThreadPoolExecutor(max_workers=len(_DB_NAMES)) as pool:
+            return list(
+                pool.map(
+                    lambda db_name: download_data(version, db_name, session), _DB_NAMES
+                )
+            )
+    finally:
+        session.close()
+
+
+def create_bundle(version: str, raw: list[bytes], /) -> DbBundle:
+    acr_raw, regex_raw, cat_raw = raw
+    acr_db = _parse_acr_db_snapshot(acr_raw)
+    return DbBundle(
+        version=version,
+        acr_db=acr_db,
+        regex_db=parse_regex_db(_decode(regex_raw, "regex_db"), acr_db, True),
+        catalogue_db=parse_catalogue_db(_decode(cat_raw, "catalogue_db"), acr_db),
+        index=AcrDbIndex(acr_db),
+        successors=AcrSuccessors(acr_db),
+    )
+
+
+@_catch_expected_err
+def load_all(version: str = CURRENT_VER, /) -> DbBundle:
+    return create_bundle(version, load_all_raw(version))
+
+
+async def _to_thread[
+    **P, R
+](func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+    import asyncio
+
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+@_catch_expected_err_async
+async def load_acr_db_async(version: str = CURRENT_VER, /) -> ACR_DB_T:
+    raw = await _to_thread(_load_raw_data, version, "acr_db")
+    return await _to_thread(_parse_acr_db_snapshot, raw)
+
+
+@_catch_expected_err_async
+async def load_regex_db_async(
+    acr_db: ACR_DB_T, version: str = CURRENT_VER, /
+) -> CCNO_DB_T:
+    raw = await _to_thread(_load_raw_data, version, "regex_db")
+    return await _to_thread(
+        lambda: parse_regex_db(_decode(raw, "regex_db"), acr_db, True)
+    )
+
+
+@_catch_expected_err_async
+async def load_catalogue_db_async(
+    acr_db: ACR_DB_T, version: str = CURRENT_VER, /
+) -> CCNO_DB_T:
+    raw = await _to_thread(_load_raw_data, version, "catalogue_db")
+    return await _to_thread(
+        lambda: parse_catalogue_db(_decode(raw, "catalogue_db"), acr_db)
+    )
+
+
+@_catch_expected_err_async
+async def load_all_async(version: str = CURRENT_VER, /) -> DbBundle:
+    raw = await _to_thread(load_all_raw, version)
+    return await _to_thread(create_bundle, version, raw)
+
+
+def report_all(version: str = CURRENT_VER, /) -> ValidationReport:
+    acr_raw, regex_raw, cat_raw = load_all_raw(version)
+    return create_validation_report(
+        _dict_guard(_decode(acr_raw, "acr_db")),
+        _dict_guard(_decode(regex_raw, "regex_db")),
+        _dict_guard(_decode(cat_raw, "catalogue_db")),
+    )
+
+
 def _dict_guard(database: Any, /) -> dict[str, Any]:
     if not isinstance(database, dict):
         raise ValJsonEx("JSON is not a dictionary")
@@ -106,9 +285,11 @@ def parse_min_acr_db(acr_db: Any) -> ACR_MIN_DB_T:
     return create_acr_min_db(dict_db)
 
 
-def parse_regex_db(regex_db: Any, acr_db: ACR_DB_T, equal_sized: bool, /) -> CCNO_DB_T:
-    return validate_regex_db(_dict_guard(regex_db), acr_db, equal_sized)
+def parse_regex_db(
+    regex_db: Any, acr_db: ACR_DB_T, equal_sized: bool, workers: int = 1, /
+) -> CCNO_DB_T:
+    return validate_regex_db(_dict_guard(regex_db), acr_db, equal_sized, workers)
 
 
-def parse_catalogue_db(regex_db: Any, acr_db: ACR_DB_T, /) -> CCNO_DB_T:
-    return validate_catalogue_db(_dict_guard(regex_db), acr_db)
+def parse_catalogue_db(regex_db: Any, acr_db: ACR_DB_T, workers: int = 1, /) -> CCNO_DB_T:
+    return validate_catalogue_db(_dict_guard(regex_db), acr_db, workers)
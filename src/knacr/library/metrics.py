@@ -0,0 +1,86 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Callable, Final, final
+
+
+_LOG: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MetricEvent:
+    name: str
+    duration: float = 0.0
+    count: int = 1
+    size: int = 0
+    labels: dict[str, str] = field(default_factory=dict)
+
+
+type METRIC_HOOK_T = Callable[[MetricEvent], None]
+
+
+def log_metric(event: MetricEvent, /) -> None:
+    _LOG.debug(
+        "%s count=%d duration=%.6f size=%d %s",
+        event.name,
+        event.count,
+        event.duration,
+        event.size,
+        " ".join(f"{key}={val}" for key, val in sorted(event.labels.items())),
+    )
+
+
+_HOOK: METRIC_HOOK_T | None = None
+
+
+def get_metric_hook() -> METRIC_HOOK_T | None:
+    return _HOOK
+
+
+def set_metric_hook(hook: METRIC_HOOK_T | None, /) -> None:
+    global _HOOK
+    _HOOK = hook
+
+
+def emit_metric(
+    name: str,
+    duration: float = 0.0,
+    count: int = 1,
+    size: int = 0,
+    /,
+    **labels: str,
+) -> None:
+    if (hook := _HOOK) is not None:
+        hook(
+            MetricEvent(
+                name=name, duration=duration, count=count, size=size, labels=labels
+            )
+        )
+
+
+@final
+class _Measure:
+    __slots__ = "size"
+
+    def __init__(self) -> None:
+        self.size = 0
+
+
+@contextmanager
+def measure(name: str, /, **labels: str) -> Iterator[_Measure]:
+    mes = _Measure()
+    if _HOOK is None:
+        yield mes
+        return
+    start = time.perf_counter()
+    outcome = {"outcome": "ok"}
+    try:
+        yield mes
+    except BaseException as exc:
+        outcome = {"outcome": "error", "error": type(exc).__name__}
+        raise
+    finally:
+        emit_metric(name, time.perf_counter() - start, 1, mes.size, **labels, **outcome)
@@ -0,0 +1,10 @@
+import os
+from pathlib import Path
+
+
+def get_default_cache_dir() -> Path:
+    if (cache_dir := os.environ.get("KNACR_CACHE_DIR", "")) != "":
+        return Path(cache_dir)
+    if (xdg_cache := os.environ.get("XDG_CACHE_HOME", "")) != "":
+        return Path(xdg_cache) / "knacr"
+    return Path.home() / ".cache" / "knacr"
@@ -0,0 +1,122 @@
+import hashlib
+import logging
+import threading
+import time
+from typing import Final, Self, final
+import warnings
+
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.bundle import DbBundle
+from knacr.errors.custom_exceptions import ReqURIEx, ValJsonEx
+from knacr.errors.custom_warnings import LoadWarn
+from knacr.library.loader import create_bundle, load_all_raw
+
+
+_LOG: Final[logging.Logger] = logging.getLogger(__name__)
+_INTERVAL: Final[float] = 3600.0
+
+
+def _create_fingerprint(raw: list[bytes], /) -> str:
+    hasher = hashlib.sha256()
+    for con in raw:
+        hasher.update(hashlib.sha256(con).digest())
+    return hasher.hexdigest()
+
+
+@final
+class RegistryHolder:
+    __slots__ = (
+        "__bundle",
+        "__fingerprint",
+        "__interval",
+        "__last_error",
+        "__lock",
+        "__refreshed",
+        "__stop",
+        "__thread",
+        "__version",
+    )
+
+    def __init__(
+        self, version: str = CURRENT_VER, interval: float = _INTERVAL, /
+    ) -> None:
+        self.__version = version
+        self.__interval = interval
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: threading.Thread | None = None
+        self.__last_error: Exception | None = None
+        self.__fingerprint = ""
+        self.__refreshed = 0.0
+        if not self.refresh():
+            warnings.warn(f"Could not load version: {version}", LoadWarn, stacklevel=2)
+            raw = load_all_raw(CURRENT_VER)
+            self.__swap(create_bundle(CURRENT_VER, raw), "")
+
+    @property
+    def bundle(self) -> DbBundle:
+        return self.__bundle
+
+    @property
+    def version(self) -> str:
+        return self.__version
+
+    @property
+    def last_error(self) -> Exception | None:
+        return self.__last_error
+
+    @property
+    def refreshed_at(self) -> float:
+        return self.__refreshed
+
+    def __swap(self, bundle: DbBundle, fingerprint: str, /) -> None:
+        self.__bundle = bundle
+        self.__fingerprint = fingerprint
+        self.__refreshed = time.time()
+
+    def refresh(self) -> bool:
+        with self.__lock:
+            try:
+                raw = load_all_raw(self.__version)
+                if (fingerprint := _create_fingerprint(raw)) == self.__fingerprint:
+                    self.__last_error = None
+                    return False
+                bundle = create_bundle(self.__version, raw)
+            except (ReqURIEx, ValJsonEx, OSError) as exc:
+                _LOG.warning("could not refresh version %s: %s", self.__version, exc)
+                self.__last_error = exc
+                return False
+            self.__swap(bundle, fingerprint)
+            self.__last_error = None
+            _LOG.info("swapped in version %s [%s]", self.__version, fingerprint[:12])
+            return True
+
+    def __run(self) -> None:
+        while not self.__stop.wait(self.__interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                _LOG.exception("unexpected error refreshing version %s", self.__version)
+                self.__last_error = exc
+
+    def start(self) -> None:
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, name="knacr-registry", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: float | None = None, /) -> None:
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self.stop()
@@ -0,0 +1,80 @@
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Any, Final, final
+
+from knacr.container.acr_db import CatArgs
+from knacr.container.bundle import DbBundle
+from knacr.container.fun.ccno import create_cat_args
+from knacr.container.links import LinkLevel
+from knacr.library.catalogue import create_ccno_links
+from knacr.library.ccno import CCNoIdentifier
+
+
+type _MATCH_T = tuple[tuple[int, CatArgs], ...]
+
+_CACHE_SIZE: Final[int] = 65536
+
+
+@final
+class CCNoResolver:
+    __slots__ = ("__bundle", "__identifier", "__match")
+
+    def __init__(self, bundle: DbBundle, cache_size: int = _CACHE_SIZE, /) -> None:
+        self.__bundle = bundle
+        self.__identifier = CCNoIdentifier(bundle.acr_db)
+        self.__match = lru_cache(maxsize=cache_size)(self.__create_match)
+
+    @property
+    def bundle(self) -> DbBundle:
+        return self.__bundle
+
+    def __create_match(self, ccno: str, /) -> _MATCH_T:
+        acr_db = self.__bundle.acr_db
+        matches = []
+        for acr_id in self.__identifier.identify(ccno):
+            if (args := create_cat_args(ccno, acr_db[acr_id])) is not None:
+                matches.append((acr_id, args))
+        return tuple(matches)
+
+    def match(self, ccno: str, /) -> _MATCH_T:
+        return self.__match(ccno.strip())
+
+    def identify(self, ccno: str, /) -> dict[str, Any]:
+        return {
+            "ccno": ccno,
+            "matches": [
+                {"id": acr_id, "acr": args.acr, "args": asdict(args)}
+                for acr_id, args in self.match(ccno)
+            ],
+        }
+
+    def resolve(self, name: str, /) -> dict[str, Any]:
+        index, successors = self.__bundle.index, self.__bundle.successors
+        return {
+            "name": name,
+            "entries": [
+                {
+                    "id": acr_id,
+                    "acr": self.__bundle.acr_db[acr_id].acr,
+                    "active": self.__bundle.acr_db[acr_id].active,
+                    "current": list(successors.current(acr_id)),
+                }
+                for acr_id in index.lookup(name)
+            ],
+        }
+
+    def links(self, ccno: str, exclude: tuple[LinkLevel, ...] = (), /) -> dict[str, Any]:
+        acr_db = self.__bundle.acr_db
+        links = []
+        for acr_id, args in self.match(ccno):
+            link = create_ccno_links(acr_db[acr_id], args, exclude)
+            links.append(
+                {
+                    "id": acr_id,
+                    "acr": args.acr,
+                    "level": link.level.value,
+                    "catalogue": link.catalogue,
+                    "homepage": link.homepage,
+                }
+            )
+        return {"ccno": ccno, "links": links}
@@ -0,0 +1,176 @@
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import threading
+from typing import Any, Final, final
+from urllib.parse import parse_qs, urlsplit
+
+from knacr.container.links import LinkLevel
+from knacr.library.registry import RegistryHolder
+from knacr.library.resolver import CCNoResolver
+
+
+_LOG: Final[logging.Logger] = logging.getLogger(__name__)
+_MAX_BODY: Final[int] = 32 * 1024 * 1024
+_MAX_BATCH: Final[int] = 100_000
+
+type _QUERY_T = dict[str, list[str]]
+type _ROUTE_T = Callable[[CCNoResolver, _QUERY_T], dict[str, Any]]
+
+
+class _BadRequest(Exception):
+    pass
+
+
+@final
+class _ResolverCache:
+    __slots__ = ("__holder", "__lock", "__resolver")
+
+    def __init__(self, holder: RegistryHolder, /) -> None:
+        self.__holder = holder
+        self.__lock = threading.Lock()
+        self.__resolver = CCNoResolver(holder.bundle)
+
+    def get(self) -> CCNoResolver:
+        bundle = self.__holder.bundle
+        if (resolver := self.__resolver).bundle is bundle:
+            return resolver
+        with self.__lock:
+            if self.__resolver.bundle is not bundle:
+                self.__resolver = CCNoResolver(bundle)
+            return self.__resolver
+
+
+def _get_param(query: _QUERY_T, name: str, /) -> str:
+    if len(values := query.get(name, [])) == 0 or values[0] == "":
+        raise _BadRequest(f"missing query parameter {name!r}")
+    return values[0]
+
+
+def _get_exclude(names: Any, /) -> tuple[LinkLevel, ...]:
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        raise _BadRequest("'exclude' must be a list of link level names")
+    try:
+        return tuple(LinkLevel(name) for name in names)
+    except ValueError as exc:
+        raise _BadRequest(f"unknown link level in {names}") from exc
+
+
+def _identify(resolver: CCNoResolver, query: _QUERY_T, /) -> dict[str, Any]:
+    return resolver.identify(_get_param(query, "ccno"))
+
+
+def _resolve(resolver: CCNoResolver, query: _QUERY_T, /) -> dict[str, Any]:
+    return resolver.resolve(_get_param(query, "name"))
+
+
+def _links(resolver: CCNoResolver, query: _QUERY_T, /) -> dict[str, Any]:
+    exclude = _get_exclude(query.get("exclude", []))
+    return resolver.links(_get_param(query, "ccno"), exclude)
+
+
+def _health(resolver: CCNoResolver, _query: _QUERY_T, /) -> dict[str, Any]:
+    return {"version": resolver.bundle.version, "entries": len(resolver.bundle.acr_db)}
+
+
+_GET_ROUTES: Final[dict[str, _ROUTE_T]] = {
+    "/identify": _identify,
+    "/resolve": _resolve,
+    "/links": _links,
+    "/health": _health,
+}
+
+
+def _batch(resolver: CCNoResolver, body: Any, /) -> dict[str, Any]:
+    if not isinstance(body, dict) or not isinstance(ccnos := body.get("ccnos"), list):
+        raise _BadRequest("expected a JSON object with a 'ccnos' list")
+    if len(ccnos) > _MAX_BATCH:
+        raise _BadRequest(f"batch exceeds {_MAX_BATCH} ccnos")
+    if not all(isinstance(ccno, str) for ccno in ccnos):
+        raise _BadRequest("all ccnos must be strings")
+    if not isinstance(links := body.get("links", False), bool):
+        raise _BadRequest("'links' must be a boolean")
+    if not links:
+        return {"results": [resolver.identify(ccno) for ccno in ccnos]}
+    exclude = _get_exclude(body.get("exclude", []))
+    return {"results": [resolver.links(ccno, exclude) for ccno in ccnos]}
+
+
+def _read_body(handler: BaseHTTPRequestHandler, /) -> Any:
+    try:
+        length = int(handler.headers.get("Content-Length", "0"))
+    except ValueError as exc:
+        raise _BadRequest("invalid Content-Length") from exc
+    if length <= 0 or length > _MAX_BODY:
+        raise _BadRequest(f"body must contain 1 to {_MAX_BODY} bytes")
+    try:
+        return json.loads(handler.rfile.read(length))
+    except ValueError as exc:
+        raise _BadRequest("body is not valid JSON") from exc
+
+
+def _close_on_error(handler: BaseHTTPRequestHandler, status: HTTPStatus, /) -> None:
+    if status != HTTPStatus.OK:
+        handler.close_connection = True
+        handler.send_header("Connection", "close")
+
+
+def _create_handler(cache: _ResolverCache, /) -> type[BaseHTTPRequestHandler]:
+    class _ResolverHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: HTTPStatus, con: dict[str, Any], /) -> None:
+            body = json.dumps(con).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            _close_on_error(self, status)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _answer(self, create: Callable[[], dict[str, Any]], /) -> None:
+            try:
+                con = create()
+            except _BadRequest as exc:
+                self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            except Exception:
+                _LOG.exception("could not answer %s", self.path)
+                con = {"error": "internal server error"}
+                self._send(HTTPStatus.INTERNAL_SERVER_ERROR, con)
+            else:
+                self._send(HTTPStatus.OK, con)
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if (route := _GET_ROUTES.get(url.path, None)) is None:
+                self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown path {url.path}"})
+                return
+            self._answer(lambda: route(cache.get(), parse_qs(url.query)))
+
+        def do_POST(self) -> None:
+            if (path := urlsplit(self.path).path) != "/batch":
+                self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown path {path}"})
+                return
+            self._answer(lambda: _batch(cache.get(), _read_body(self)))
+
+        def log_message(self, fmt: str, *args: Any) -> None:
+            _LOG.debug(fmt, *args)
+
+    return _ResolverHandler
+
+
+def create_server(holder: RegistryHolder, host: str, port: int, /) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _create_handler(_ResolverCache(holder)))
+    server.daemon_threads = True
+    return server
+
+
+def serve(holder: RegistryHolder, host: str, port: int, /) -> None:
+    server = create_server(holder, host, port)
+    _LOG.info("serving knacr %s on %s:%d", holder.bundle.version, host, port)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,98 @@
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import stat
+import sys
+from typing import TypeGuard, final
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from knacr.constants.types import ACR_DB_T
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.acr_db import AcrDbEntry
+from knacr.library.paths import get_default_cache_dir
+
+
+def create_snapshot_key(raw: bytes, /) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(f"knacr:{CURRENT_VER};pydantic:{PYDANTIC_VERSION};".encode())
+    hasher.update(raw)
+    return hasher.hexdigest()
+
+
+def _is_acr_db(acr_db: object, /) -> TypeGuard[ACR_DB_T]:
+    return isinstance(acr_db, dict) and all(
+        isinstance(acr_id, int) and isinstance(acr_con, AcrDbEntry)
+        for acr_id, acr_con in acr_db.items()
+    )
+
+
+def _is_private(path: Path, /) -> bool:
+    if not hasattr(os, "getuid"):
+        return False
+    info = path.stat()
+    writable = stat.S_IWGRP | stat.S_IWOTH
+    return info.st_uid == os.getuid() and info.st_mode & writable == 0
+
+
+@final
+class SnapshotStore:
+    __slots__ = "__root"
+
+    def __init__(self, root: Path | None = None, /) -> None:
+        self.__root = get_default_cache_dir() / "snapshots" if root is None else root
+
+    @property
+    def root(self) -> Path:
+        return self.__root
+
+    def get_path(self, raw: bytes, /) -> Path:
+        return self.__root / f"{create_snapshot_key(raw)}.pickle"
+
+    def load(self, raw: bytes, /) -> ACR_DB_T | None:
+        path = self.get_path(raw)
+        try:
+            if not (_is_private(self.__root) and _is_private(path)):
+                return None
+            # root and file are owned by this user and writable by no one else
+            acr_db = pickle.loads(path.read_bytes())  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not _is_acr_db(acr_db):
+            return None
+        return acr_db
+
+    def store(self, raw: bytes, acr_db: ACR_DB_T, /) -> Path | None:
+        path = self.get_path(raw)
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(path.parent):
+                return None
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with os.fdopen(
+                os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+            ) as fhd:
+                fhd.write(pickle.dumps(acr_db, protocol=pickle.HIGHEST_PROTOCOL))
+            tmp.replace(path)
+        except OSError:
+            return None
+        return path
+
+
+_SNAPSHOTS: SnapshotStore | None = SnapshotStore()
+
+
+def get_snapshot_store() -> SnapshotStore | None:
+    return _SNAPSHOTS
+
+
+def set_snapshot_store(store: SnapshotStore | None, /) -> None:
+    global _SNAPSHOTS
+    _SNAPSHOTS = store
+
+
+if __name__ == "__main__":
+    from knacr.library.loader import create_current_snapshot
+
+    print(create_current_snapshot(Path(sys.argv[1]) if len(sys.argv) > 1 else None))
@@ -0,0 +1,327 @@
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+import os
+from pathlib import Path
+from queue import Queue
+import sqlite3
+from typing import Any, Final, Self, final
+from uuid import UUID
+
+from knacr.constants.types import ACR_DB_T, CCNO_DB_T
+from knacr.container.acr_db import AcrChaT, AcrDbEntry
+from knacr.container.fun.format import uuid_to_str
+from knacr.errors.custom_exceptions import ValJsonEx
+
+
+type _EDGE_T = tuple[tuple[int, AcrChaT], ...]
+
+_SCHEMA_VER: Final[str] = "1"
+_POOL_SIZE: Final[int] = 4
+_CACHE_SIZE: Final[int] = 4096
+_EXAMPLE_DBS: Final[tuple[str, str]] = ("regex_db", "catalogue_db")
+_SCHEMA: Final = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE acr (
+    id INTEGER PRIMARY KEY,
+    acr TEXT NOT NULL,
+    code TEXT NOT NULL,
+    country TEXT NOT NULL,
+    active INTEGER NOT NULL,
+    deprecated INTEGER NOT NULL,
+    ror TEXT,
+    gbif TEXT,
+    entry TEXT NOT NULL
+);
+CREATE TABLE synonym (id INTEGER NOT NULL, synonym TEXT NOT NULL);
+CREATE TABLE change (
+    id INTEGER NOT NULL, target INTEGER NOT NULL, type TEXT NOT NULL
+);
+CREATE TABLE regex_db (
+    id INTEGER NOT NULL, pos INTEGER NOT NULL, ccno TEXT NOT NULL
+);
+CREATE TABLE catalogue_db (
+    id INTEGER NOT NULL, pos INTEGER NOT NULL, ccno TEXT NOT NULL
+);
+CREATE INDEX acr_acr ON acr (acr);
+CREATE INDEX acr_code ON acr (code);
+CREATE INDEX acr_country ON acr (country);
+CREATE INDEX acr_status ON acr (active, deprecated);
+CREATE INDEX acr_ror ON acr (ror) WHERE ror IS NOT NULL;
+CREATE INDEX acr_gbif ON acr (gbif) WHERE gbif IS NOT NULL;
+CREATE INDEX synonym_synonym ON synonym (synonym, id);
+CREATE INDEX synonym_id ON synonym (id);
+CREATE INDEX change_id ON change (id);
+CREATE INDEX change_target ON change (target);
+CREATE INDEX regex_db_id ON regex_db (id, pos);
+CREATE INDEX catalogue_db_id ON catalogue_db (id, pos);
+"""
+_BY_COLUMN: Final[dict[str, str]] = {
+    col: f"SELECT id FROM acr WHERE {col} = ? ORDER BY id"  # noqa: S608
+    for col in ("acr", "code", "country", "ror", "gbif")
+}
+
+
+def _none_if_empty(val: str, /) -> str | None:
+    return None if val == "" else val
+
+
+def _write_sqlite(
+    con: sqlite3.Connection,
+    acr_db: ACR_DB_T,
+    regex_db: CCNO_DB_T,
+    catalogue_db: CCNO_DB_T,
+    version: str,
+    /,
+) -> None:
+    con.executescript(_SCHEMA)
+    con.executemany(
+        "INSERT INTO meta VALUES (?, ?)",
+        [("schema", _SCHEMA_VER), ("version", version)],
+    )
+    con.executemany(
+        "INSERT INTO acr VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                acr_id,
+                acr_con.acr,
+                acr_con.code,
+                acr_con.country,
+                acr_con.active,
+                acr_con.deprecated,
+                _none_if_empty(acr_con.ror),
+                _none_if_empty(uuid_to_str(acr_con.gbif)),
+                acr_con.model_dump_json(exclude_defaults=True),
+            )
+            for acr_id, acr_con in sorted(acr_db.items())
+        ),
+    )
+    con.executemany(
+        "INSERT INTO synonym VALUES (?, ?)",
+        (
+            (acr_id, syn)
+            for acr_id, acr_con in acr_db.items()
+            for syn in acr_con.acr_synonym
+        ),
+    )
+    con.executemany(
+        "INSERT INTO change VALUES (?, ?, ?)",
+        (
+            (acr_id, cha.id, cha.type.value)
+            for acr_id, acr_con in acr_db.items()
+            for cha in acr_con.acr_changed_to
+        ),
+    )
+    for table, ccno_db in zip(_EXAMPLE_DBS, (regex_db, catalogue_db), strict=True):
+        con.executemany(
+            f"INSERT INTO {table} VALUES (?, ?, ?)",  # noqa: S608
+            (
+                (acr_id, pos, ccno)
+                for acr_id, ccnos in ccno_db.items()
+                for pos, ccno in enumerate(ccnos)
+            ),
+        )
+
+
+def export_sqlite(
+    path: Path,
+    acr_db: ACR_DB_T,
+    regex_db: CCNO_DB_T,
+    catalogue_db: CCNO_DB_T,
+    version: str,
+    /,
+) -> Path:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    con = sqlite3.connect(tmp)
+    try:
+        with con:
+            _write_sqlite(con, acr_db, regex_db, catalogue_db, version)
+        con.execute("VACUUM")
+    except BaseException:
+        con.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    con.close()
+    tmp.replace(path)
+    return path
+
+
+def _connect(path: Path, /) -> sqlite3.Connection:
+    con = sqlite3.connect(
+        f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    con.execute("PRAGMA query_only = ON")
+    return con
+
+
+@final
+class SqliteAcrDb(Mapping[int, AcrDbEntry]):
+    __slots__ = ("__closed", "__entry", "__path", "__pool", "__size", "__version")
+
+    def __init__(self, path: Path, pool_size: int = _POOL_SIZE, /) -> None:
+        if not path.is_file():
+            raise ValJsonEx(f"sqlite registry {path} does not exist")
+        self.__path = path
+        self.__size = pool_size
+        self.__closed = False
+        self.__pool: Queue[sqlite3.Connection] = Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self.__pool.put(_connect(path))
+        self.__entry = lru_cache(maxsize=_CACHE_SIZE)(self.__create_entry)
+        try:
+            meta = dict(self.__fetch("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError as exc:
+            self.close()
+            raise ValJsonEx(f"{path} is not a sqlite registry: {exc}") from exc
+        if meta.get("schema", "") != _SCHEMA_VER:
+            self.close()
+            raise ValJsonEx(f"unsupported sqlite registry schema in {path}")
+        self.__version: str = meta.get("version", "")
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @property
+    def version(self) -> str:
+        return self.__version
+
+    @contextmanager
+    def __connection(self) -> Iterator[sqlite3.Connection]:
+        if self.__closed:
+            raise sqlite3.ProgrammingError(f"sqlite registry {self.__path} is closed")
+        con = self.__pool.get()
+        try:
+            yield con
+        finally:
+            self.__pool.put(con)
+
+    def __fetch(self, query: str, *args: object) -> list[Any]:
+        with self.__connection() as con:
+            return con.execute(query, args).fetchall()
+
+    def __fetch_ids(self, query: str, *args: object) -> tuple[int, ...]:
+        return tuple(row[0] for row in self.__fetch(query, *args))
+
+    def __create_entry(self, acr_id: int, /) -> AcrDbEntry:
+        rows = self.__fetch("SELECT entry FROM acr WHERE id = ?", acr_id)
+        if len(rows) == 0:
+            raise KeyError(acr_id)
+        return AcrDbEntry.model_validate_json(rows[0][0])
+
+    def __getitem__(self, acr_id: int, /) -> AcrDbEntry:
+        return self.__entry(acr_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__fetch_ids("SELECT id FROM acr ORDER BY id"))
+
+    def __len__(self) -> int:
+        count: int = self.__fetch("SELECT count(*) FROM acr")[0][0]
+        return count
+
+    def __contains__(self, acr_id: object, /) -> bool:
+        return (
+            isinstance(acr_id, int)
+            and len(self.__fetch("SELECT 1 FROM acr WHERE id = ?", acr_id)) > 0
+        )
+
+    def by_acr(self, acr: str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(_BY_COLUMN["acr"], acr)
+
+    def by_synonym(self, synonym: str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(
+            "SELECT DISTINCT id FROM synonym WHERE synonym = ? ORDER BY id", synonym
+        )
+
+    def by_code(self, code: str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(_BY_COLUMN["code"], code)
+
+    def by_country(self, country: str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(_BY_COLUMN["country"], country)
+
+    def by_ror(self, ror: str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(_BY_COLUMN["ror"], ror)
+
+    def by_gbif(self, gbif: UUID | str, /) -> tuple[int, ...]:
+        return self.__fetch_ids(_BY_COLUMN["gbif"], str(gbif).lower())
+
+    def by_status(self, active: bool, deprecated: bool = False, /) -> tuple[int, ...]:
+        return self.__fetch_ids(
+            "SELECT id FROM acr WHERE active = ? AND deprecated = ? ORDER BY id",
+            active,
+            deprecated,
+        )
+
+    def by_name(self, acr: str, /) -> tuple[int, ...]:
+        return tuple(sorted({*self.by_acr(acr), *self.by_synonym(acr)}))
+
+    def lookup(self, key: str, /) -> tuple[int, ...]:
+        return tuple(
+            sorted(
+                {
+                    *self.by_acr(key),
+                    *self.by_synonym(key),
+                    *self.by_code(key),
+                    *self.by_ror(key),
+                    *self.by_gbif(key),
+                }
+            )
+        )
+
+    def changed_to(self, acr_id: int, /) -> _EDGE_T:
+        rows = self.__fetch(
+            "SELECT target, type FROM change WHERE id = ? ORDER BY rowid", acr_id
+        )
+        return tuple((target, AcrChaT(typ)) for target, typ in rows)
+
+    def changed_from(self, acr_id: int, /) -> _EDGE_T:
+        rows = self.__fetch(
+            "SELECT id, type FROM change WHERE target = ? ORDER BY id, rowid", acr_id
+        )
+        return tuple((source, AcrChaT(typ)) for source, typ in rows)
+
+    def __examples(self, table: str, acr_id: int, /) -> list[str]:
+        rows = self.__fetch(
+            f"SELECT ccno FROM {table} WHERE id = ? ORDER BY pos",  # noqa: S608
+            acr_id,
+        )
+        return [row[0] for row in rows]
+
+    def regex_examples(self, acr_id: int, /) -> list[str]:
+        return self.__examples("regex_db", acr_id)
+
+    def catalogue_examples(self, acr_id: int, /) -> list[str]:
+        return self.__examples("catalogue_db", acr_id)
+
+    def __example_db(self, table: str, /) -> CCNO_DB_T:
+        ccno_db: CCNO_DB_T = {}
+        rows = self.__fetch(
+            f"SELECT id, ccno FROM {table} ORDER BY id, pos"  # noqa: S608
+        )
+        for acr_id, ccno in rows:
+            ccno_db.setdefault(acr_id, []).append(ccno)
+        return ccno_db
+
+    def to_acr_db(self) -> ACR_DB_T:
+        return {acr_id: self[acr_id] for acr_id in self}
+
+    def to_regex_db(self) -> CCNO_DB_T:
+        return self.__example_db("regex_db")
+
+    def to_catalogue_db(self) -> CCNO_DB_T:
+        return self.__example_db("catalogue_db")
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__entry.cache_clear()
+        for _ in range(self.__size):
+            self.__pool.get().close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self.close()
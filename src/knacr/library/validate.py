@@ -1,26 +1,39 @@
-from typing import Any, Callable, Final
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Final, final
 import re
+import time
 
 from pydantic import ValidationError
 from knacr.constants.types import ACR_DB_T, CCNO_DB_T
 
 from knacr.container.acr_db import (
-    ACR_MIN_CON,
-    CCNO_DB_CON,
-    CCNO_DB_KEYS,
     AcrCoreReg,
     AcrDbEntry,
-    ACR_DB_KEYS,
+    get_acr_min_adapter,
+    get_ccno_db_adapter,
+    get_db_keys_adapter,
+)
+from knacr.container.fun.acr_db import (
+    check_uri_template,
+    create_acr_db,
+    create_acr_db_entry,
+    create_ccno_db,
 )
-from knacr.container.fun.acr_db import check_uri_template, create_acr_db, create_ccno_db
 from knacr.container.fun.format import url_to_str, uuid_to_str
+from knacr.container.report import ValidationIssue, ValidationReport
+from knacr.container.successor import AcrSuccessors, check_changed_to_graph
 from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.metrics import measure
 
 
 _ACR: Final[re.Pattern[str]] = re.compile(r"^[A-Z:]+$")
 _ACR_SPL: Final[re.Pattern[str]] = re.compile(r":")
 _CORE_ID: Final[re.Pattern[str]] = re.compile(r"^\d+(\D\d+)*$")
 _CL_REGEX: Final[re.Pattern[str]] = re.compile(r"[()\][]")
+_OR_END: Final[str] = ""
+_DB_KEY: Final[re.Pattern[str]] = re.compile(r"^[1-9][0-9]*$")
+_SHARDS_PER_WORKER: Final[int] = 4
 
 type _UNIQUE_GEN = tuple[str, str, str, str]
 type _UNIQUE_GID = tuple[str, str, str]
@@ -48,6 +61,14 @@ def _check_unique_gid(
     return unique_id
 
 
+def _get_ror(acr_db: AcrDbEntry, /) -> str:
+    return acr_db.ror
+
+
+def _get_gbif(acr_db: AcrDbEntry, /) -> str:
+    return uuid_to_str(acr_db.gbif)
+
+
 def _check_active(cur_acr_con: AcrDbEntry, /) -> None:
     if not cur_acr_con.active and url_to_str(cur_acr_con.homepage) != "":
         raise ValJsonEx(
@@ -100,10 +121,13 @@ def _check_db_composition(cur_acr_con: AcrDbEntry, acr_db: ACR_DB_T, /) -> None:
     _check_active(cur_acr_con)
 
 
+def _find_missing_link_ids(all_ids: set[int], /) -> list[int]:
+    return [ind for ind in range(1, max(all_ids, default=0) + 1) if ind not in all_ids]
+
+
 def _check_missing_link_id(all_ids: set[int], /) -> None:
-    for ind in range(1, max(all_ids) + 1):
-        if ind not in all_ids:
-            raise ValJsonEx(f"missing acr id {ind}")
+    for ind in _find_missing_link_ids(all_ids):
+        raise ValJsonEx(f"missing acr id {ind}")
 
 
 def _check_acr(acr: str, /) -> None:
@@ -126,17 +150,28 @@ def _check_regex_start_end(reg_full: list[str], reg_part: list[str], /) -> None:
             raise ValJsonEx(f"invalid part regex {reg}")
 
 
+def _find_prefix_or(or_ch: str, pos: int, no_pos: int, tree: dict[str, Any], /) -> int:
+    node, first = tree, no_pos
+    for char in or_ch:
+        first = min(first, node.get(_OR_END, no_pos))
+        node = node.setdefault(char, {})
+    first = min(first, node.get(_OR_END, no_pos))
+    node.setdefault(_OR_END, pos)
+    return int(first)
+
+
 def _check_or_order(regex: str, bid: int, /) -> None:
     if "|" in regex:
-        cl_reg = _CL_REGEX.sub("", regex)
-        ors = cl_reg.split("|")
-        for cnt, or_ch in enumerate(ors):
-            for com_ch in ors[cnt + 1 :]:
-                if com_ch.startswith(or_ch):
-                    raise ValJsonEx(
-                        f"regex for collection {bid} has a smaller"
-                        f" substring before the longer string {or_ch} - {regex}"
-                    )
+        ors = _CL_REGEX.sub("", regex).split("|")
+        tree: dict[str, Any] = {}
+        first = min(
+            _find_prefix_or(or_ch, pos, len(ors), tree) for pos, or_ch in enumerate(ors)
+        )
+        if first < len(ors):
+            raise ValJsonEx(
+                f"regex for collection {bid} has a smaller"
+                f" substring before the longer string {ors[first]} - {regex}"
+            )
 
 
 def _check_regex(r_ccno: str, r_id: AcrCoreReg, bid: int, /) -> None:
@@ -147,12 +182,12 @@ def _check_regex(r_ccno: str, r_id: AcrCoreReg, bid: int, /) -> None:
         raise ValJsonEx(
             f"regex for ccno must contain regex for id: {r_id.full} -> {r_ccno}"
         )
-    pre_suf = re.compile(rf"^(.*){re.escape(r_id.core)}(.*)$").match(r_id.full[1:-1])
-    if pre_suf is None or len(pre_suf.groups()) < 2:
+    if (core_pos := r_id.full[1:-1].rfind(r_id.core)) < 0:
         raise ValJsonEx(
             f"regex for id must contain regex for core: {r_id.core} -> {r_id.full}"
         )
-    pre, *_, suf = pre_suf.groups()
+    pre = r_id.full[1 : core_pos + 1]
+    suf = r_id.full[core_pos + len(r_id.core) + 1 : -1]
     for typ, fps, rps in [("prefix", pre, r_id.pre), ("suffix", suf, r_id.suf)]:
         if not isinstance(fps, str) or rps not in fps or (rps == "" and fps != ""):
             raise ValJsonEx(f"{typ} defines a different {rps} regex than the full id")
@@ -160,17 +195,6 @@ def _check_regex(r_ccno: str, r_id: AcrCoreReg, bid: int, /) -> None:
     _check_or_order(r_id.pre, bid)
 
 
-def _check_loops(cur: AcrDbEntry, full: ACR_DB_T, ids: set[int], /) -> None:
-    for changed in cur.acr_changed_to:
-        changed_to = full.get(changed.id, None)
-        if changed.id in ids:
-            raise ValJsonEx(f"loop detected in {ids} for {cur.acr}")
-        if changed_to is None:
-            raise ValJsonEx(f"missing changed to id {changed.id} for acronym {cur.acr}")
-        ids.add(changed.id)
-        _check_loops(changed_to, full, ids)
-
-
 def _check_ids_overlap(ccno_db: set[int], acr_db: set[int], equal_sized: bool, /) -> None:
     if len(mis_ids := ccno_db - acr_db) != 0:
         raise ValJsonEx(f"ccno db missing the following ids: {mis_ids!s}")
@@ -179,19 +203,28 @@ def _check_ids_overlap(ccno_db: set[int], acr_db: set[int], equal_sized: bool, /
         raise ValJsonEx(f"ccno db and acronym db have different sizes: {mis_ids}")
 
 
+def _check_examples(reg_id: int, reg_con: list[str], /) -> None:
+    filtered = list(filter(lambda ccno: ccno != "", reg_con))
+    if len(filtered) == 0:
+        raise ValJsonEx(f"{reg_id} does not have any valid examples")
+    if len(filtered) != len(set(filtered)):
+        raise ValJsonEx(f"{reg_id} does have duplicate examples")
+
+
 def _check_malformed_list(reg_db: CCNO_DB_T, /) -> None:
     for reg_id, reg_con in reg_db.items():
-        filtered = list(filter(lambda ccno: ccno != "", reg_con))
-        if len(filtered) == 0:
-            raise ValJsonEx(f"{reg_id} does not have any valid examples")
-        if len(filtered) != len(set(filtered)):
-            raise ValJsonEx(f"{reg_id} does have duplicate examples")
+        _check_examples(reg_id, reg_con)
+
+
+@lru_cache(maxsize=8192)
+def _compile(regex: str, /) -> re.Pattern[str]:
+    return re.compile(regex)
 
 
 def _apply_regex(acr_id: int, acr_con: AcrDbEntry, ccnos: list[str], /) -> None:
-    reg_ccno = re.compile(acr_con.regex_ccno)
-    reg_ccno_id = re.compile(acr_con.regex_id.full[1:])
-    reg_core_id = re.compile(rf"^.*?({acr_con.regex_id.core}).*$")
+    reg_ccno = _compile(acr_con.regex_ccno)
+    reg_ccno_id = _compile(acr_con.regex_id.full[1:])
+    reg_core_id = _compile(rf"^.*?({acr_con.regex_id.core}).*$")
     for ccno in ccnos:
         core_id_m = reg_core_id.match(ccno)
         if core_id_m is None:
@@ -211,6 +244,41 @@ def _apply_regex(acr_id: int, acr_con: AcrDbEntry, ccnos: list[str], /) -> None:
             )
 
 
+type _SHARD_T = list[tuple[int, AcrDbEntry, list[str]]]
+
+
+def _apply_regex_shard(shard: _SHARD_T, /) -> str | None:
+    try:
+        for acr_id, acr_con, ccnos in shard:
+            _apply_regex(acr_id, acr_con, ccnos)
+    except ValJsonEx as exc:
+        return exc.message
+    return None
+
+
+def _create_shards(ccno_db: CCNO_DB_T, acr_db: ACR_DB_T, cnt: int, /) -> list[_SHARD_T]:
+    work = [
+        (acr_id, acr_con, ccno_db[acr_id])
+        for acr_id, acr_con in acr_db.items()
+        if acr_id in ccno_db
+    ]
+    size = max(1, -(-len(work) // cnt))
+    return [work[start : start + size] for start in range(0, len(work), size)]
+
+
+def _apply_regex_db(ccno_db: CCNO_DB_T, acr_db: ACR_DB_T, workers: int, /) -> None:
+    if workers <= 1:
+        for acr_id, acr_con in acr_db.items():
+            if acr_id in ccno_db:
+                _apply_regex(acr_id, acr_con, ccno_db[acr_id])
+        return
+    shards = _create_shards(ccno_db, acr_db, workers * _SHARDS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for err in pool.map(_apply_regex_shard, shards):
+            if err is not None:
+                raise ValJsonEx(err)
+
+
 def _validate_acr_db_dc(acr_db: ACR_DB_T, /) -> None:
     all_ids = set(acr_db.keys())
     _check_missing_link_id(all_ids)
@@ -219,79 +287,301 @@ def _validate_acr_db_dc(acr_db: ACR_DB_T, /) -> None:
     for acr_id, acr_con in acr_db.items():
         check_uri_template(acr_con.catalogue)
         uni_gen.add(_check_unique_gen(uni_gen, acr_con))
-        uni_gid.add(_check_unique_gid(uni_gid, acr_con, lambda db: db.ror, "ror"))
-        uni_gid.add(
-            _check_unique_gid(uni_gid, acr_con, lambda db: uuid_to_str(db.gbif), "gbif")
-        )
+        uni_gid.add(_check_unique_gid(uni_gid, acr_con, _get_ror, "ror"))
+        uni_gid.add(_check_unique_gid(uni_gid, acr_con, _get_gbif, "gbif"))
         _check_db_composition(acr_con, acr_db)
         _check_acr(acr_con.acr)
         _check_regex(acr_con.regex_ccno, acr_con.regex_id, acr_id)
         _check_acr_in_reg(acr_con.acr, acr_con.regex_ccno)
-        _check_loops(acr_con, acr_db, {acr_id})
+    AcrSuccessors(acr_db)
 
 
-def _validate_regex_dc(reg_db: CCNO_DB_T, acr_db: ACR_DB_T, equal_sized: bool, /) -> None:
+def _validate_acr_db_update_dc(acr_db: ACR_DB_T, changed: set[int], /) -> None:
+    uni_gen: set[tuple[str, str, str, str]] = set()
+    uni_gid: set[tuple[str, str, str]] = set()
+    for acr_con in acr_db.values():
+        uni_gen.add(_check_unique_gen(uni_gen, acr_con))
+        uni_gid.add(_check_unique_gid(uni_gid, acr_con, _get_ror, "ror"))
+        uni_gid.add(_check_unique_gid(uni_gid, acr_con, _get_gbif, "gbif"))
+    neighbours = set(changed)
+    for acr_id, acr_con in acr_db.items():
+        if any(cha.id in changed for cha in acr_con.acr_changed_to):
+            neighbours.add(acr_id)
+    for acr_id in sorted(neighbours & acr_db.keys()):
+        acr_con = acr_db[acr_id]
+        check_uri_template(acr_con.catalogue)
+        _check_db_composition(acr_con, acr_db)
+        _check_acr(acr_con.acr)
+        _check_regex(acr_con.regex_ccno, acr_con.regex_id, acr_id)
+        _check_acr_in_reg(acr_con.acr, acr_con.regex_ccno)
+    check_changed_to_graph(acr_db, (acr_id for acr_id in changed if acr_id in acr_db))
+
+
+def _validate_regex_dc(
+    reg_db: CCNO_DB_T, acr_db: ACR_DB_T, equal_sized: bool, workers: int, /
+) -> None:
     all_reg_ids = set(reg_db.keys())
     _check_missing_link_id(all_reg_ids)
     _check_malformed_list(reg_db)
     _check_ids_overlap(all_reg_ids, set(acr_db.keys()), equal_sized)
-    for acr_id, acr_con in acr_db.items():
-        if acr_id in reg_db:
-            _apply_regex(acr_id, acr_con, reg_db[acr_id])
+    _apply_regex_db(reg_db, acr_db, workers)
 
 
-def _validate_catalogue_dc(cat_db: CCNO_DB_T, acr_db: ACR_DB_T, /) -> None:
+def _validate_catalogue_dc(cat_db: CCNO_DB_T, acr_db: ACR_DB_T, workers: int, /) -> None:
     all_cat_ids = set(cat_db.keys())
     all_acr_ids = set(cid for cid, adb in acr_db.items() if len(adb.catalogue) != 0)
     _check_malformed_list(cat_db)
     _check_ids_overlap(all_cat_ids, all_acr_ids, True)
-    for acr_id, acr_con in acr_db.items():
-        if acr_id in cat_db:
-            _apply_regex(acr_id, acr_con, cat_db[acr_id])
+    _apply_regex_db(cat_db, acr_db, workers)
+
+
+def check_acr_db(acr_db: ACR_DB_T, /) -> None:
+    if len(acr_db) > 0:
+        with measure("validate", db_name="acr_db"):
+            _validate_acr_db_dc(acr_db)
+
+
+def check_acr_db_update(acr_db: ACR_DB_T, changed: set[int], /) -> None:
+    if len(acr_db) == 0:
+        return
+    _check_missing_link_id(set(acr_db.keys()))
+    with measure("validate_update", db_name="acr_db"):
+        _validate_acr_db_update_dc(acr_db, changed)
+
+
+def validate_acr_db_keys(to_eval: dict[str, Any], /) -> None:
+    msg = "Acronym database is incorrectly formatted!"
+    try:
+        get_db_keys_adapter().validate_python(list(to_eval.keys()))
+    except ValidationError as exc:
+        raise ValJsonEx(f"{msg} [{exc!s}]") from exc
+
+
+def validate_acr_db_entry(acr_id: int, to_eval: Any, /) -> AcrDbEntry:
+    msg = f"Acronym database entry {acr_id} is incorrectly formatted!"
+    if not isinstance(to_eval, dict):
+        raise ValJsonEx(f"{msg} [expected dict got {type(to_eval)}]")
+    try:
+        return create_acr_db_entry(to_eval)
+    except ValidationError as exc:
+        raise ValJsonEx(f"{msg} [{exc!s}]") from exc
 
 
 def validate_acr_db(to_eval: dict[str, Any], /) -> ACR_DB_T:
     msg = "Acronym database is incorrectly formatted!"
     try:
-        ACR_DB_KEYS.validate_python(list(to_eval.keys()))
-        acr_db = create_acr_db(to_eval)
+        get_db_keys_adapter().validate_python(list(to_eval.keys()))
+        with measure("model_build", db_name="acr_db"):
+            acr_db = create_acr_db(to_eval)
     except ValidationError as exc:
         raise ValJsonEx(f"{msg} [{exc!s}]") from exc
-    if len(acr_db) > 0:
-        _validate_acr_db_dc(acr_db)
+    check_acr_db(acr_db)
     return acr_db
 
 
 def validate_min_acr_db_schema(to_eval: dict[str, Any], /) -> None:
     msg = "Acronym min database is incorrectly formatted!"
     try:
-        ACR_DB_KEYS.validate_python(list(to_eval.keys()))
-        ACR_MIN_CON.validate_python(list(to_eval.values()))
+        get_db_keys_adapter().validate_python(list(to_eval.keys()))
+        get_acr_min_adapter().validate_python(list(to_eval.values()))
     except ValidationError as exc:
         raise ValJsonEx(f"{msg} [{exc!s}]") from exc
 
 
 def _validate_ccno_db_struct(msg: str, to_eval: dict[str, Any], /) -> None:
     try:
-        CCNO_DB_KEYS.validate_python(list(to_eval.keys()))
-        CCNO_DB_CON.validate_python(list(to_eval.values()))
+        get_db_keys_adapter().validate_python(list(to_eval.keys()))
+        get_ccno_db_adapter().validate_python(list(to_eval.values()))
     except ValidationError as exc:
         raise ValJsonEx(f"{msg} [{exc!s}]") from exc
 
 
 def validate_regex_db(
-    to_eval: dict[str, Any], acr_db: ACR_DB_T, equal_sized: bool, /
+    to_eval: dict[str, Any], acr_db: ACR_DB_T, equal_sized: bool, workers: int = 1, /
 ) -> CCNO_DB_T:
     msg = "Regex data is incorrectly formatted!"
     _validate_ccno_db_struct(msg, to_eval)
-    regex_db = create_ccno_db(to_eval)
-    _validate_regex_dc(regex_db, acr_db, equal_sized)
+    with measure("model_build", db_name="regex_db"):
+        regex_db = create_ccno_db(to_eval)
+    with measure("validate", db_name="regex_db"):
+        _validate_regex_dc(regex_db, acr_db, equal_sized, workers)
     return regex_db
 
 
-def validate_catalogue_db(to_eval: dict[str, Any], acr_db: ACR_DB_T, /) -> CCNO_DB_T:
+def validate_catalogue_db(
+    to_eval: dict[str, Any], acr_db: ACR_DB_T, workers: int = 1, /
+) -> CCNO_DB_T:
     msg = "Catalogue data is incorrectly formatted!"
     _validate_ccno_db_struct(msg, to_eval)
-    catalogue = create_ccno_db(to_eval)
-    _validate_catalogue_dc(catalogue, acr_db)
+    with measure("model_build", db_name="catalogue_db"):
+        catalogue = create_ccno_db(to_eval)
+    with measure("validate", db_name="catalogue_db"):
+        _validate_catalogue_dc(catalogue, acr_db, workers)
     return catalogue
+
+
+@final
+class _ReportCollector:
+    __slots__ = ("__db_name", "__issues", "__timings")
+
+    def __init__(
+        self, issues: list[ValidationIssue], timings: dict[str, float], /
+    ) -> None:
+        self.__db_name = ""
+        self.__issues = issues
+        self.__timings = timings
+
+    def switch(self, db_name: str, /) -> None:
+        self.__db_name = db_name
+
+    def add(self, check: str, acr_id: int | None, message: str, /) -> None:
+        self.__issues.append(
+            ValidationIssue(
+                db_name=self.__db_name, check=check, acr_id=acr_id, message=message
+            )
+        )
+
+    def count(self, check: str, /) -> int:
+        return sum(
+            1
+            for issue in self.__issues
+            if issue.check == check and issue.db_name == self.__db_name
+        )
+
+    def run[
+        **P, T
+    ](
+        self,
+        check: str,
+        acr_id: int | None,
+        fun: Callable[P, T],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> (T | None):
+        start = time.perf_counter()
+        try:
+            return fun(*args, **kwargs)
+        except ValJsonEx as exc:
+            self.add(check, acr_id, exc.message)
+        finally:
+            key = f"{self.__db_name}.{check}"
+            self.__timings[key] = self.__timings.get(key, 0.0) + (
+                time.perf_counter() - start
+            )
+        return None
+
+
+def _report_db_keys(
+    col: _ReportCollector, to_eval: dict[str, Any], dense: bool, /
+) -> set[int]:
+    keys: set[int] = set()
+    for key in to_eval.keys():
+        if isinstance(key, str) and _DB_KEY.match(key) is not None:
+            keys.add(int(key))
+        else:
+            col.add("keys", None, f"invalid database key {key!r}")
+    for ind in _find_missing_link_ids(keys) if dense else []:
+        col.add("missing_id", ind, f"missing acr id {ind}")
+    return keys
+
+
+def _report_acr_entries(col: _ReportCollector, to_eval: dict[str, Any], /) -> ACR_DB_T:
+    acr_db: ACR_DB_T = {}
+    for acr_id in sorted(_report_db_keys(col, to_eval, True)):
+        raw = to_eval[str(acr_id)]
+        if (
+            entry := col.run("schema", acr_id, validate_acr_db_entry, acr_id, raw)
+        ) is not None:
+            acr_db[acr_id] = entry
+    return acr_db
+
+
+def _report_acr_entry(
+    col: _ReportCollector,
+    acr_id: int,
+    acr_con: AcrDbEntry,
+    acr_db: ACR_DB_T,
+    uni_gen: set[_UNIQUE_GEN],
+    uni_gid: set[_UNIQUE_GID],
+    /,
+) -> None:
+    col.run("uri_template", acr_id, check_uri_template, acr_con.catalogue)
+    if (
+        gen := col.run("unique", acr_id, _check_unique_gen, uni_gen, acr_con)
+    ) is not None:
+        uni_gen.add(gen)
+    for gid_type, gid in [("ror", _get_ror), ("gbif", _get_gbif)]:
+        unique = col.run(
+            "unique", acr_id, _check_unique_gid, uni_gid, acr_con, gid, gid_type
+        )
+        if unique is not None:
+            uni_gid.add(unique)
+    col.run("changed_to", acr_id, _check_changed_to_id, acr_con, acr_db)
+    col.run("deprecated", acr_id, _check_deprecated, acr_con)
+    col.run("active", acr_id, _check_active, acr_con)
+    col.run("acr", acr_id, _check_acr, acr_con.acr)
+    col.run("regex", acr_id, _check_regex, acr_con.regex_ccno, acr_con.regex_id, acr_id)
+    col.run("acr_in_regex", acr_id, _check_acr_in_reg, acr_con.acr, acr_con.regex_ccno)
+
+
+def _report_acr_db(col: _ReportCollector, to_eval: dict[str, Any], /) -> ACR_DB_T:
+    col.switch("acr_db")
+    acr_db = _report_acr_entries(col, to_eval)
+    uni_gen: set[_UNIQUE_GEN] = set()
+    uni_gid: set[_UNIQUE_GID] = set()
+    for acr_id, acr_con in acr_db.items():
+        _report_acr_entry(col, acr_id, acr_con, acr_db, uni_gen, uni_gid)
+    if col.count("changed_to") == 0:
+        col.run("changed_to_graph", None, AcrSuccessors, acr_db)
+    return acr_db
+
+
+def _parse_ccno_entry(msg: str, to_eval: dict[str, Any], /) -> CCNO_DB_T:
+    _validate_ccno_db_struct(msg, to_eval)
+    return create_ccno_db(to_eval)
+
+
+def _report_ccno_db(
+    col: _ReportCollector,
+    msg: str,
+    to_eval: dict[str, Any],
+    acr_db: ACR_DB_T,
+    acr_ids: set[int],
+    dense: bool,
+    equal_sized: bool,
+    /,
+) -> None:
+    ccno_db: CCNO_DB_T = {}
+    for reg_id in sorted(_report_db_keys(col, to_eval, dense)):
+        raw = {str(reg_id): to_eval[str(reg_id)]}
+        if (entry := col.run("schema", reg_id, _parse_ccno_entry, msg, raw)) is None:
+            continue
+        ccno_db.update(entry)
+        col.run("examples", reg_id, _check_examples, reg_id, ccno_db[reg_id])
+    col.run("ids_overlap", None, _check_ids_overlap, set(ccno_db), acr_ids, equal_sized)
+    for acr_id, acr_con in acr_db.items():
+        if acr_id in ccno_db:
+            col.run("match", acr_id, _apply_regex, acr_id, acr_con, ccno_db[acr_id])
+
+
+def create_validation_report(
+    acr_db: dict[str, Any],
+    regex_db: dict[str, Any] | None = None,
+    catalogue_db: dict[str, Any] | None = None,
+    equal_sized: bool = True,
+    /,
+) -> ValidationReport:
+    report = ValidationReport()
+    col = _ReportCollector(report.issues, report.timings)
+    valid_acr = _report_acr_db(col, acr_db)
+    if regex_db is not None:
+        col.switch("regex_db")
+        msg = "Regex data is incorrectly formatted!"
+        _report_ccno_db(col, msg, regex_db, valid_acr, set(valid_acr), True, equal_sized)
+    if catalogue_db is not None:
+        col.switch("catalogue_db")
+        cat_ids = set(cid for cid, adb in valid_acr.items() if len(adb.catalogue) != 0)
+        msg = "Catalogue data is incorrectly formatted!"
+        _report_ccno_db(col, msg, catalogue_db, valid_acr, cat_ids, False, True)
+    return report
@@ -1,13 +1,128 @@
-from knacr.errors.custom_exceptions import ValJsonEx
-from knacr.library.loader import load_acr_db
+import argparse
+from collections.abc import Sequence
+from pathlib import Path
+import sys
+from typing import Final
 
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.links import LinkLevel
 
-def run() -> None:
-    # TODO no real functionality yet
+
+_COMMANDS: Final[frozenset[str]] = frozenset(
+    {"serve", "batch", "export", "min-db", "-h", "--help"}
+)
+
+
+def _add_serve_args(parser: argparse.ArgumentParser, /) -> None:
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--version", dest="data_version", default=CURRENT_VER)
+    parser.add_argument(
+        "--refresh",
+        type=float,
+        default=0.0,
+        help="seconds between data refreshes, 0 disables refreshing",
+    )
+
+
+def _add_batch_args(parser: argparse.ArgumentParser, /) -> None:
+    parser.add_argument("input", nargs="?", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--format", dest="fmt", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--version", dest="data_version", default=CURRENT_VER)
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        choices=[lvl.value for lvl in (LinkLevel.cat, LinkLevel.home)],
+        default=[],
+    )
+
+
+def _add_export_args(parser: argparse.ArgumentParser, /) -> None:
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--version", dest="data_version", default=CURRENT_VER)
+
+
+def _add_min_db_args(parser: argparse.ArgumentParser, /) -> None:
+    parser.add_argument("output", type=Path)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="acr_db", description="knAcr resolver")
+    sub = parser.add_subparsers(dest="command")
+    _add_serve_args(sub.add_parser("serve", help="start a local HTTP resolver"))
+    _add_batch_args(sub.add_parser("batch", help="resolve a file of CCNos"))
+    _add_export_args(sub.add_parser("export", help="write the registry to SQLite"))
+    _add_min_db_args(
+        sub.add_parser("min-db", help="regenerate the min acronym db projection")
+    )
+    return parser
+
+
+def _run_serve(args: argparse.Namespace, /) -> None:
+    from knacr.library.registry import RegistryHolder
+    from knacr.library.server import serve
+
+    if args.refresh > 0:
+        with RegistryHolder(args.data_version, args.refresh) as holder:
+            serve(holder, args.host, args.port)
+    else:
+        serve(RegistryHolder(args.data_version), args.host, args.port)
+
+
+def _run_batch(args: argparse.Namespace, /) -> None:
+    from knacr.library.batch import write_batch
+
+    exclude = tuple(LinkLevel(lvl) for lvl in args.exclude)
+    batch = (args.fmt, exclude, args.data_version, args.workers)
+    in_fhd = sys.stdin if args.input is None else args.input.open(encoding="utf-8")
+    out_fhd = (
+        sys.stdout
+        if args.output is None
+        else args.output.open("w", encoding="utf-8", newline="")
+    )
     try:
-        load_acr_db()
-    except ValJsonEx:
-        print("installed knacr version is not compatible with the latest data")
+        write_batch(in_fhd, out_fhd, *batch)
+    finally:
+        for fhd in (in_fhd, out_fhd):
+            if fhd not in (sys.stdin, sys.stdout):
+                fhd.close()
+
+
+def _run_export(args: argparse.Namespace, /) -> None:
+    from knacr.library.loader import load_all
+    from knacr.library.sqlite import export_sqlite
+
+    bundle = load_all(args.data_version)
+    export_sqlite(
+        args.output,
+        bundle.acr_db,
+        bundle.regex_db,
+        bundle.catalogue_db,
+        bundle.version,
+    )
+
+
+def _run_min_db(args: argparse.Namespace, /) -> None:
+    from knacr.library.loader import create_current_min_projection
+
+    print(create_current_min_projection(args.output))
+
+
+def run(argv: Sequence[str] | None = None, /) -> None:
+    cli = list(sys.argv[1:] if argv is None else argv)
+    if len(cli) == 0 or cli[0] not in _COMMANDS:
+        cli.insert(0, "serve")
+    args = _create_parser().parse_args(cli)
+    if args.command == "batch":
+        _run_batch(args)
+    elif args.command == "export":
+        _run_export(args)
+    elif args.command == "min-db":
+        _run_min_db(args)
+    else:
+        _run_serve(args)
 
 
 if __name__ == "__main__":
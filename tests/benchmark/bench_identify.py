@@ -0,0 +1,45 @@
+from importlib import resources
+import json
+import re
+import timeit
+
+from knacr import data
+from knacr.constants.types import ACR_DB_T
+from knacr.library.ccno import CCNoIdentifier
+from knacr.library.loader import parse_acr_db
+
+
+def _load_json(db_name: str, /) -> dict[str, list[str]]:
+    with resources.files(data).joinpath(f"{db_name}.json").open("rb") as fhd:
+        loaded: dict[str, list[str]] = json.load(fhd)
+        return loaded
+
+
+def _naive_identify(acr_db: ACR_DB_T, ccnos: list[str], /) -> list[list[int]]:
+    regex = [(acr_id, re.compile(con.regex_ccno)) for acr_id, con in acr_db.items()]
+    return [[acr_id for acr_id, reg in regex if reg.match(ccno)] for ccno in ccnos]
+
+
+def run(repeat: int = 5, /) -> dict[str, float]:
+    acr_db = parse_acr_db(_load_json("acr_db"))
+    ccnos = [ccno for exa in _load_json("regex_db").values() for ccno in exa]
+    ccnos = [*ccnos, *(f"XYZ {num}" for num in range(len(ccnos)))] * 20
+    identifier = CCNoIdentifier(acr_db)
+    naive = min(
+        timeit.repeat(lambda: _naive_identify(acr_db, ccnos), number=1, repeat=repeat)
+    )
+    engine = min(
+        timeit.repeat(
+            lambda: [identifier.identify(ccno) for ccno in ccnos], number=1, repeat=repeat
+        )
+    )
+    return {
+        "ccnos": float(len(ccnos)),
+        "naive_s": naive,
+        "engine_s": engine,
+        "speedup": naive / engine,
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(run(), indent=2))
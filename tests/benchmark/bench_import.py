@@ -0,0 +1,67 @@
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Final
+
+
+_MODULES: Final[tuple[str, ...]] = ("knacr", "knacr.library.loader", "knacr.main")
+_HEAVY: Final[tuple[str, ...]] = ("requests", "pydantic", "asyncio")
+_LINE: Final[re.Pattern[str]] = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$"
+)
+
+
+def _import_once(module: str, /) -> dict[str, float]:
+    probe = f"import sys, {module}; print(' '.join(sorted(sys.modules)))"
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    loaded = set(proc.stdout.split())
+    times = {
+        mat.group(4): int(mat.group(2))
+        for line in proc.stderr.splitlines()
+        if (mat := _LINE.match(line)) is not None
+    }
+    result = {"cumulative_ms": times.get(module, 0) / 1000}
+    for heavy in _HEAVY:
+        result[f"{heavy}_loaded"] = float(heavy in loaded)
+    return result
+
+
+def _run_module(module: str, repeat: int, /) -> dict[str, float]:
+    runs = [_import_once(module) for _ in range(repeat)]
+    return min(runs, key=lambda run: run["cumulative_ms"])
+
+
+def run(
+    modules: tuple[str, ...] = _MODULES, repeat: int = 5, /
+) -> dict[str, dict[str, float]]:
+    return {module: _run_module(module, repeat) for module in modules}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="knAcr import time benchmark")
+    parser.add_argument("--module", nargs="+", default=list(_MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=0.0,
+        help="fail if any module needs more ms to import, 0 disables the check",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    result = run(tuple(args.module), args.repeat)
+    print(json.dumps(result, indent=2))
+    if args.budget > 0 and any(
+        res["cumulative_ms"] > args.budget for res in result.values()
+    ):
+        sys.exit(1)
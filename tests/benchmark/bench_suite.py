@@ -0,0 +1,112 @@
+import argparse
+import gc
+import json
+from pathlib import Path
+import platform
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from knacr.constants.types import ACR_DB_T
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.acr_db import CatArgs
+from knacr.container.compact import CompactAcrDb
+from knacr.container.fun.acr_db import replace_param_value
+from knacr.container.fun.format import url_to_str
+from knacr.library.catalogue import create_ccno_links
+from knacr.library.ccno import parse_ccnos
+from knacr.library.loader import parse_acr_db, parse_catalogue_db, parse_regex_db
+from tests.benchmark.synthetic import create_dataset
+
+
+def _time(fun: Callable[[], Any], items: int, repeat: int, /) -> dict[str, float]:
+    best = min(timeit.repeat(fun, number=1, repeat=repeat))
+    return {"items": float(items), "best_s": best, "items_per_s": items / best}
+
+
+def _trace(build: Callable[[], Any], /) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def _create_compact(acr_raw: dict[str, Any], /) -> CompactAcrDb:
+    return CompactAcrDb(parse_acr_db(acr_raw))
+
+
+def _measure_memory(acr_raw: dict[str, Any], /) -> dict[str, float]:
+    full = _trace(lambda: parse_acr_db(acr_raw))
+    compact = _trace(lambda: _create_compact(acr_raw))
+    return {
+        "acr_db_bytes": float(full),
+        "compact_acr_db_bytes": float(compact),
+        "compact_ratio": compact / full,
+    }
+
+
+def _create_renders(
+    acr_db: ACR_DB_T, parsed: list[tuple[int, CatArgs]], /
+) -> list[tuple[str, CatArgs]]:
+    return [
+        (url_to_str(cat), args)
+        for acr_id, args in parsed
+        for cat in acr_db[acr_id].catalogue
+    ]
+
+
+def run(size: int, repeat: int = 3, /) -> dict[str, Any]:
+    acr_raw, regex_raw, cat_raw = create_dataset(size)
+    acr_db = parse_acr_db(acr_raw)
+    ccnos = [ccno for exa in regex_raw.values() for ccno in exa]
+    parsed = list(parse_ccnos(ccnos, acr_db))
+    renders = _create_renders(acr_db, parsed)
+    return {
+        "knacr": CURRENT_VER,
+        "python": platform.python_version(),
+        "size": size,
+        "results": {
+            "parse_acr_db": _time(lambda: parse_acr_db(acr_raw), size, repeat),
+            "parse_regex_db": _time(
+                lambda: parse_regex_db(regex_raw, acr_db, True), len(ccnos), repeat
+            ),
+            "parse_catalogue_db": _time(
+                lambda: parse_catalogue_db(cat_raw, acr_db), len(cat_raw), repeat
+            ),
+            "replace_param_value": _time(
+                lambda: [replace_param_value(href, args) for href, args in renders],
+                len(renders),
+                repeat,
+            ),
+            "create_ccno_links": _time(
+                lambda: [create_ccno_links(acr_db[cid], args) for cid, args in parsed],
+                len(parsed),
+                repeat,
+            ),
+            "compact_acr_db": _time(lambda: CompactAcrDb(acr_db), size, repeat),
+        },
+        "memory": _measure_memory(acr_raw),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="knAcr benchmark suite")
+    parser.add_argument("--size", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_args()
+    result = json.dumps([run(size, args.repeat) for size in args.size], indent=2)
+    if args.output is None:
+        print(result)
+    else:
+        args.output.write_text(result)
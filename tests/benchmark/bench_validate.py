@@ -0,0 +1,35 @@
+import json
+import sys
+import timeit
+
+from knacr.library.validate import check_acr_db, validate_acr_db
+from tests.benchmark.synthetic import create_acr_db
+
+
+def _run_size(size: int, repeat: int, /) -> dict[str, float]:
+    raw = create_acr_db(size)
+    acr_db = validate_acr_db(raw)
+    full = min(timeit.repeat(lambda: validate_acr_db(raw), number=1, repeat=repeat))
+    consistency = min(
+        timeit.repeat(lambda: check_acr_db(acr_db), number=1, repeat=repeat)
+    )
+    return {
+        "entries": float(size),
+        "validate_s": full,
+        "consistency_s": consistency,
+        "consistency_us_per_entry": consistency / size * 1e6,
+    }
+
+
+def run(
+    sizes: tuple[int, ...] = (10_000, 100_000), repeat: int = 3, /
+) -> dict[str, dict[str, float]]:
+    return {str(size): _run_size(size, repeat) for size in sizes}
+
+
+if __name__ == "__main__":
+    print(
+        json.dumps(
+            run(tuple(int(arg) for arg in sys.argv[1:]) or (10_000, 100_000)), indent=2
+        )
+    )
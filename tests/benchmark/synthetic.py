@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+import sys
+from typing import Any, Final
+import uuid
+
+_LETTERS: Final[str] = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_COUNTRIES: Final[tuple[str, ...]] = ("DE", "FR", "GB", "JP", "US", "BR", "IN", "CN")
+_GBIF_NS: Final[uuid.UUID] = uuid.UUID("6ba7b811-9dad-11d1-80b4-00c04fd430c8")
+_PRE_EVERY: Final[int] = 7
+_CHANGED_EVERY: Final[int] = 10
+_CHAIN_EVERY: Final[int] = 50
+_SYNONYM_EVERY: Final[int] = 3
+_ZERO_CORE_EVERY: Final[int] = 11
+_DEPRECATED_EVERY: Final[int] = 97
+
+type SYNTHETIC_T = tuple[dict[str, Any], dict[str, list[str]], dict[str, list[str]]]
+
+
+def create_acr(acr_id: int, /) -> str:
+    letters = []
+    num = acr_id
+    while num > 0:
+        num, rest = divmod(num - 1, len(_LETTERS))
+        letters.append(_LETTERS[rest])
+    return "SY" + "".join(reversed(letters))
+
+
+def _has_prefix(acr_id: int, /) -> bool:
+    return acr_id % _PRE_EVERY == 0
+
+
+def _is_deprecated(acr_id: int, /) -> bool:
+    return acr_id % _DEPRECATED_EVERY == 0
+
+
+def _is_active(acr_id: int, /) -> bool:
+    return acr_id % _CHANGED_EVERY != 0 and not _is_deprecated(acr_id)
+
+
+def _create_changed_to(acr_id: int, /) -> list[dict[str, Any]]:
+    changed = [(acr_id - 1, "synonym")]
+    if acr_id % _CHAIN_EVERY == 0 and acr_id > _CHAIN_EVERY:
+        changed.append((acr_id - _CHANGED_EVERY, "transfer"))
+    return [
+        {"id": cha_id, "type": cha_type}
+        for cha_id, cha_type in changed
+        if not _is_deprecated(cha_id)
+    ]
+
+
+def create_example(acr_id: int, /) -> str:
+    pre = "ABC"[acr_id % 3] if _has_prefix(acr_id) else ""
+    return f"{create_acr(acr_id)} {pre}{acr_id}"
+
+
+def _create_regex(acr: str, acr_id: int, /) -> dict[str, Any]:
+    if not _has_prefix(acr_id):
+        return {"regex_ccno": rf"^{acr}\s*\d+$", "regex_id": {"full": r"^\d+$"}}
+    return {
+        "regex_ccno": rf"^{acr}\s*(A|B|C)\d+$",
+        "regex_id": {"full": r"^(A|B|C)\d+$", "core": r"\d+", "pre": "(A|B|C)"},
+    }
+
+
+def _create_catalogue(acr: str, acr_id: int, /) -> str:
+    domain = f"https://{acr.lower()}.example.org"
+    if _has_prefix(acr_id):
+        return f"{domain}/strain/{{acr}}-{{pre}}<->{{core}}"
+    if acr_id % _ZERO_CORE_EVERY == 0:
+        return f"{domain}/strain?id={{core0:8}}"
+    return f"{domain}/strain/{{id}}"
+
+
+def _create_links(acr: str, acr_id: int, /) -> dict[str, Any]:
+    if _is_deprecated(acr_id):
+        return {"deprecated": True}
+    if not _is_active(acr_id):
+        return {"acr_changed_to": _create_changed_to(acr_id)}
+    links: dict[str, Any] = {
+        "homepage": f"https://{acr.lower()}.example.org/",
+        "catalogue": [_create_catalogue(acr, acr_id)],
+    }
+    if acr_id % _SYNONYM_EVERY == 0:
+        links["acr_synonym"] = [f"{acr}:SYN"]
+    return links
+
+
+def create_acr_entry(acr_id: int, /) -> dict[str, Any]:
+    acr = create_acr(acr_id)
+    return {
+        "acr": acr,
+        "code": acr,
+        "name": f"Synthetic Culture Collection {acr}",
+        "country": _COUNTRIES[acr_id % len(_COUNTRIES)],
+        "active": _is_active(acr_id),
+        "ror": f"0syn{acr_id:05x}",
+        "gbif": str(uuid.uuid5(_GBIF_NS, acr)),
+        **_create_regex(acr, acr_id),
+        **_create_links(acr, acr_id),
+    }
+
+
+def create_acr_db(size: int, /) -> dict[str, Any]:
+    return {str(acr_id): create_acr_entry(acr_id) for acr_id in range(1, size + 1)}
+
+
+def create_regex_db(size: int, /) -> dict[str, list[str]]:
+    return {str(acr_id): [create_example(acr_id)] for acr_id in range(1, size + 1)}
+
+
+def create_catalogue_db(size: int, /) -> dict[str, list[str]]:
+    return {
+        str(acr_id): [create_example(acr_id)]
+        for acr_id in range(1, size + 1)
+        if _is_active(acr_id)
+    }
+
+
+def create_dataset(size: int, /) -> SYNTHETIC_T:
+    return create_acr_db(size), create_regex_db(size), create_catalogue_db(size)
+
+
+def write_dataset(size: int, out_dir: Path, /) -> list[Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for db_name, con in zip(
+        ("acr_db", "regex_db", "catalogue_db"), create_dataset(size), strict=True
+    ):
+        (path := out_dir / f"{db_name}.json").write_text(json.dumps(con, indent=2))
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in write_dataset(int(sys.argv[1]), Path(sys.argv[2])):
+        print(path)
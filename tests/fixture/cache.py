@@ -0,0 +1,32 @@
+from collections.abc import Iterator
+from pathlib import Path
+import pytest
+
+from knacr.library.download import (
+    DownloadCache,
+    get_download_cache,
+    set_download_cache,
+)
+from knacr.library.snapshot import SnapshotStore, get_snapshot_store, set_snapshot_store
+
+
+@pytest.fixture
+def tmp_download_cache(tmp_path: Path) -> Iterator[DownloadCache]:
+    old_cache, old_store = get_download_cache(), get_snapshot_store()
+    cache = DownloadCache(tmp_path)
+    set_download_cache(cache)
+    set_snapshot_store(SnapshotStore(tmp_path / "snapshots"))
+    yield cache
+    set_download_cache(old_cache)
+    set_snapshot_store(old_store)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tmp_snapshot_store(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[SnapshotStore]:
+    old_store = get_snapshot_store()
+    store = SnapshotStore(tmp_path_factory.mktemp("snapshots"))
+    set_snapshot_store(store)
+    yield store
+    set_snapshot_store(old_store)
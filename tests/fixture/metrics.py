@@ -0,0 +1,13 @@
+from collections.abc import Iterator
+import pytest
+
+from knacr.library.metrics import MetricEvent, get_metric_hook, set_metric_hook
+
+
+@pytest.fixture
+def metric_events() -> Iterator[list[MetricEvent]]:
+    old_hook = get_metric_hook()
+    events: list[MetricEvent] = []
+    set_metric_hook(events.append)
+    yield events
+    set_metric_hook(old_hook)
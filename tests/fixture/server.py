@@ -0,0 +1,18 @@
+from collections.abc import Iterator
+from http.server import ThreadingHTTPServer
+from threading import Thread
+import pytest
+
+from tests.fixture.stand_in import DataServer, create_handler
+
+
+@pytest.fixture
+def data_server() -> Iterator[DataServer]:
+    state = DataServer()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), create_handler(state))
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield state
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler
+from typing import Any, final
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class DataServer:
+    url: str = ""
+    body: bytes = b"{}"
+    etag: str = '"v1"'
+    files: dict[str, bytes] = field(default_factory=dict)
+    requests: list[str] = field(default_factory=list)
+    not_modified: list[str] = field(default_factory=list)
+    strict: bool = False
+
+
+def create_handler(state: DataServer, /) -> type[BaseHTTPRequestHandler]:
+    class _DataHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            state.requests.append(self.path)
+            missing = state.strict and self.path not in state.files
+            if missing or self.path.endswith("missing.json"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match", "") == state.etag:
+                state.not_modified.append(self.path)
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = state.files.get(self.path, state.body)
+            self.send_response(200)
+            self.send_header("ETag", state.etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args: Any) -> None:
+            return
+
+    return _DataHandler
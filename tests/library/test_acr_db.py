@@ -1,8 +1,24 @@
 import json
+import sys
+from typing import Any
 import pytest
 
+from knacr.container import acr_db as acr_db_mod
+from knacr.container.acr_db import AcrChaCon, AcrChaT
+from knacr.container.compact import CompactAcrDb
+from knacr.container.index import AcrDbIndex
+from knacr.container.successor import AcrSuccessors
 from knacr.errors.custom_exceptions import ValJsonEx
-from knacr.library.loader import parse_acr_db, parse_min_acr_db, parse_regex_db
+from knacr.library.lazy import LazyAcrDb
+from knacr.library.loader import (
+    parse_acr_db,
+    parse_catalogue_db,
+    parse_min_acr_db,
+    parse_regex_db,
+    report_all,
+)
+from knacr.library.validate import create_validation_report
+from tests.benchmark.synthetic import create_dataset
 
 
 pytest_plugins = ("tests.fixture.data",)
@@ -41,3 +57,165 @@ class TestAcrDb:
         for acr_id in main_reg.keys():
             if cur_reg.get(acr_id, None) is None:
                 pytest.fail(f"missing main id in the new database - {acr_id}")
+
+    def test_lazy_adapters(self) -> None:
+        from knacr.container.acr_db import (
+            ACR_DB_KEYS,
+            ACR_MIN_CON,
+            CCNO_DB_CON,
+            CCNO_DB_KEYS,
+        )
+
+        assert ACR_DB_KEYS is CCNO_DB_KEYS is acr_db_mod.get_db_keys_adapter()
+        assert ACR_MIN_CON is acr_db_mod.get_acr_min_adapter()
+        assert CCNO_DB_CON is acr_db_mod.get_ccno_db_adapter()
+        assert "ACR_DB_KEYS" not in vars(acr_db_mod)
+        with pytest.raises(AttributeError):
+            _ = acr_db_mod.MISSING_ADAPTER
+
+    def test_lazy_acr_db(self, load_fix_acr_db: bytes) -> None:
+        lazy_db = LazyAcrDb(json.loads(load_fix_acr_db))
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        assert len(lazy_db) == len(acr_db)
+        assert lazy_db.materialized == 0
+        assert lazy_db[1] == acr_db[1]
+        assert lazy_db[1] is lazy_db[1]
+        assert lazy_db.materialized == 1
+        assert lazy_db.validate() == acr_db
+
+    def test_lazy_acr_db_broken(self, load_fix_acr_db: bytes) -> None:
+        raw_db = json.loads(load_fix_acr_db)
+        raw_db["2"]["acr"] = "lower"
+        lazy_db = LazyAcrDb(raw_db)
+        assert lazy_db[1].acr == "DSM"
+        with pytest.raises(ValJsonEx):
+            lazy_db[2]
+        with pytest.raises(ValJsonEx):
+            LazyAcrDb({"0": raw_db["1"]})
+
+    def test_acr_db_index(self, load_fix_acr_db: bytes) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        index = AcrDbIndex(acr_db)
+        assert index.by_acr("DSM") == (1,)
+        assert index.by_synonym("DSMZ") == (1,)
+        assert index.by_name("DSMZ") == (1,)
+        assert index.by_acr("DSMZ") == ()
+        gbif = acr_db[1].gbif
+        assert gbif is not None
+        assert 1 in index.by_gbif(gbif)
+        assert 1 in index.by_gbif(str(gbif).upper())
+        assert 1 in index.lookup(acr_db[1].ror)
+        for acr_id, acr_con in acr_db.items():
+            assert acr_id in index.by_code(acr_con.code)
+            assert acr_id in index.lookup(acr_con.acr)
+            for syn in acr_con.acr_synonym:
+                assert acr_id in index.by_synonym(syn)
+        assert index.lookup("UNKNOWN") == ()
+
+    def test_acr_db_successors(self, load_fix_acr_db: bytes) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        successors = AcrSuccessors(acr_db)
+        assert successors.current(1) == (1,)
+        assert successors.current(31) == (25,)
+        assert successors.successors(31) == (
+            (25, (AcrChaT.unk, AcrChaT.unk)),
+            (26, (AcrChaT.unk,)),
+        )
+        for acr_id, acr_con in acr_db.items():
+            for cur_id in successors.current(acr_id):
+                assert acr_db[cur_id].active
+            if acr_con.active:
+                assert successors.successors(acr_id) == ()
+
+    def test_acr_db_successors_loop(self, load_fix_acr_db: bytes) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        loop = [AcrChaCon(id=31, type=AcrChaT.unk)]
+        acr_db[25] = acr_db[25].model_copy(update={"acr_changed_to": loop})
+        with pytest.raises(ValJsonEx, match="loop detected"):
+            AcrSuccessors(acr_db)
+        missing = [AcrChaCon(id=len(acr_db) + 1, type=AcrChaT.unk)]
+        acr_db[25] = acr_db[25].model_copy(update={"acr_changed_to": missing})
+        with pytest.raises(ValJsonEx, match="missing changed to id"):
+            AcrSuccessors(acr_db)
+
+    def test_parallel_example_validation(
+        self,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        serial = parse_regex_db(json.loads(load_fix_regex_db), acr_db, True)
+        assert parse_regex_db(json.loads(load_fix_regex_db), acr_db, True, 2) == serial
+        cat_db = json.loads(load_fix_catalogue_db)
+        assert parse_catalogue_db(cat_db, acr_db, 2) == parse_catalogue_db(cat_db, acr_db)
+
+    def test_parallel_example_validation_error(
+        self, load_fix_acr_db: bytes, load_fix_regex_db: bytes
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        regex_db = json.loads(load_fix_regex_db)
+        for acr_id in ("90", "12", "57"):
+            regex_db[acr_id] = [*regex_db[acr_id], "XYZ 12"]
+        with pytest.raises(ValJsonEx) as serial:
+            parse_regex_db(regex_db, acr_db, True)
+        with pytest.raises(ValJsonEx) as parallel:
+            parse_regex_db(regex_db, acr_db, True, 3)
+        assert parallel.value.message == serial.value.message
+
+    def test_validation_report(self) -> None:
+        report = report_all()
+        assert report.ok, report.issues
+        assert "acr_db.regex" in report.timings
+        assert "catalogue_db.match" in report.timings
+
+    def test_validation_report_collects_all(
+        self, load_fix_acr_db: bytes, load_fix_regex_db: bytes
+    ) -> None:
+        acr_db = json.loads(load_fix_acr_db)
+        regex_db = json.loads(load_fix_regex_db)
+        acr_db["3"]["acr"] = "dsm"
+        acr_db["5"]["active"] = False
+        acr_db["7"]["regex_id"]["full"] = "^X$"
+        regex_db["12"] = [*regex_db["12"], "XYZ 12"]
+        del regex_db["20"]
+        report = create_validation_report(acr_db, regex_db)
+        assert [(iss.db_name, iss.check, iss.acr_id) for iss in report.issues] == [
+            ("acr_db", "schema", 3),
+            ("acr_db", "active", 5),
+            ("acr_db", "regex", 7),
+            ("regex_db", "missing_id", 20),
+            ("regex_db", "ids_overlap", None),
+            ("regex_db", "match", 7),
+            ("regex_db", "match", 12),
+        ]
+
+    def test_synthetic_dataset(self) -> None:
+        acr_raw, regex_raw, cat_raw = create_dataset(1_000)
+        acr_db = parse_acr_db(acr_raw)
+        assert len(parse_regex_db(regex_raw, acr_db, True)) == len(acr_db)
+        assert len(parse_catalogue_db(cat_raw, acr_db)) == len(cat_raw)
+        assert create_validation_report(acr_raw, regex_raw, cat_raw).ok
+
+    def test_compact_acr_db(self, load_fix_acr_db: bytes) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        compact = CompactAcrDb(acr_db)
+        assert len(compact) == len(acr_db)
+        assert list(compact) == sorted(acr_db)
+        assert compact[1].acr == acr_db[1].acr
+        assert compact[1].country is sys.intern(acr_db[1].country)
+        assert 0 not in compact
+        assert len(acr_db) + 1 not in compact
+        assert compact.to_entry(1) == acr_db[1]
+        assert compact.to_acr_db() == acr_db
+        with pytest.raises(KeyError):
+            compact[len(acr_db) + 1]
+        keys: list[Any] = ["1", None, 1.5]
+        for key in keys:
+            assert key not in compact
+            assert compact.get(key, 5) == 5
+            with pytest.raises(KeyError):
+                compact[key]
+        del acr_db[2]
+        with pytest.raises(ValJsonEx, match="missing acr id"):
+            CompactAcrDb(acr_db)
@@ -0,0 +1,77 @@
+import csv
+from dataclasses import replace
+import io
+import json
+from pathlib import Path
+
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.links import LinkLevel
+from knacr.library.batch import CSV_HEADER, _format_csv, resolve_batch, write_batch
+from knacr.library.loader import load_all
+from knacr.library.resolver import CCNoResolver
+from knacr.main import run
+
+
+pytest_plugins = ("tests.fixture.data", "tests.fixture.cache")
+
+
+def _create_lines(regex_db: bytes, /) -> list[str]:
+    ccnos = [ccno for exa in json.loads(regex_db).values() for ccno in exa]
+    return [f"{ccno}\n" for ccno in [*ccnos, "XYZ 1", ""] * 3]
+
+
+class TestBatch:
+    def test_batch_jsonl(self, load_fix_regex_db: bytes) -> None:
+        lines = _create_lines(load_fix_regex_db)
+        out = "".join(resolve_batch(lines, "jsonl", (), CURRENT_VER, 1, 7))
+        rows = [json.loads(row) for row in out.splitlines()]
+        assert [row["ccno"] for row in rows] == [line.strip() for line in lines]
+        assert rows[0]["links"][0]["level"] == LinkLevel.cat.value
+        assert all(
+            row["links"] == []
+            for row, line in zip(rows, lines, strict=True)
+            if line == "\n"
+        )
+
+    def test_batch_parallel(self, load_fix_regex_db: bytes) -> None:
+        lines = _create_lines(load_fix_regex_db)
+        for fmt in ["jsonl", "csv"]:
+            serial = "".join(resolve_batch(lines, fmt, (), CURRENT_VER, 1, 7))
+            parallel = "".join(resolve_batch(lines, fmt, (), CURRENT_VER, 2, 7))
+            assert parallel == serial
+
+    def test_batch_csv(self, load_fix_regex_db: bytes) -> None:
+        out = io.StringIO()
+        exclude = (LinkLevel.cat,)
+        write_batch(_create_lines(load_fix_regex_db), out, "csv", exclude, CURRENT_VER)
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        assert tuple(rows[0]) == CSV_HEADER
+        assert all(row[5] == "" for row in rows[1:])
+        assert ["XYZ 1", "", "", LinkLevel.emp.value, "", ""] in [row[1:] for row in rows]
+        assert ["", "", "", LinkLevel.emp.value, "", ""] in [row[1:] for row in rows]
+        lines = _create_lines(load_fix_regex_db)
+        assert [int(row[0]) for row in rows[1:]] == list(range(1, len(lines) + 1))
+        assert all(row[1] == lines[int(row[0]) - 1].strip() for row in rows[1:])
+
+    def test_batch_csv_ambiguous(self) -> None:
+        bundle = load_all(CURRENT_VER)
+        acr_db = {**bundle.acr_db, max(bundle.acr_db) + 1: bundle.acr_db[1]}
+        resolver = CCNoResolver(replace(bundle, acr_db=acr_db))
+        out = _format_csv(resolver, 5, ["XYZ 1", "DSM 1", ""], ())
+        rows = list(csv.reader(io.StringIO(out)))
+        assert [row[:3] for row in rows] == [
+            ["5", "XYZ 1", ""],
+            ["6", "DSM 1", "1"],
+            ["6", "DSM 1", str(max(acr_db))],
+            ["7", "", ""],
+        ]
+
+    def test_batch_cli(self, tmp_path: Path, load_fix_regex_db: bytes) -> None:
+        (in_file := tmp_path / "ccnos.txt").write_text(
+            "".join(_create_lines(load_fix_regex_db))
+        )
+        out_file = tmp_path / "links.jsonl"
+        run(["batch", str(in_file), "--output", str(out_file)])
+        assert len(out_file.read_text().splitlines()) == len(
+            _create_lines(load_fix_regex_db)
+        )
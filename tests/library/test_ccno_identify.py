@@ -0,0 +1,105 @@
+import json
+import re
+
+from knacr.container.acr_db import CatArgs
+from knacr.container.fun.ccno import get_literal_prefix
+from knacr.library.ccno import (
+    CCNoIdentifier,
+    CCNoNormalizer,
+    CCNoNormStats,
+    parse_ccnos,
+)
+from knacr.library.loader import parse_acr_db
+
+
+pytest_plugins = ("tests.fixture.data", "tests.fixture.links")
+
+
+class TestCcnoIdentify:
+    def test_literal_prefix(self) -> None:
+        assert get_literal_prefix(r"^DSM\s*\d+$") == "DSM"
+        assert get_literal_prefix(r"^TBRC-BCC\s*\d+$") == "TBRC-BCC"
+        assert get_literal_prefix(r"^HAMBI[:]?\s*\d+$") == "HAMBI"
+        assert get_literal_prefix(r"^DSMZ?\s*\d+$") == "DSM"
+        assert get_literal_prefix(r"^DSM\s*\d+$|^LMG\s*\d+$") == ""
+        assert get_literal_prefix(r"DSM\s*\d+$") == ""
+
+    def test_identify_examples(
+        self, load_fix_acr_db: bytes, load_fix_regex_db: bytes
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        identifier = CCNoIdentifier(acr_db)
+        for acr_id, ccnos in json.loads(load_fix_regex_db).items():
+            for ccno in ccnos:
+                naive = [
+                    cid
+                    for cid, con in sorted(acr_db.items())
+                    if re.match(con.regex_ccno, ccno)
+                ]
+                assert int(acr_id) in identifier.identify(ccno)
+                assert naive == identifier.identify(ccno)
+
+    def test_identify_unknown(self, load_fix_acr_db: bytes) -> None:
+        identifier = CCNoIdentifier(parse_acr_db(json.loads(load_fix_acr_db)))
+        assert identifier.identify("XYZ 1234") == []
+        assert identifier.identify("") == []
+        assert identifier.identify("DSM") == []
+
+    def test_parse_examples(
+        self, load_fix_acr_db: bytes, load_fix_regex_db: bytes
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        for acr_id, ccnos in json.loads(load_fix_regex_db).items():
+            parsed = list(parse_ccnos(iter(ccnos), acr_db))
+            assert len(parsed) == len(ccnos)
+            for cid, args in parsed:
+                assert cid == int(acr_id)
+                assert args.core != ""
+                assert args.core in args.id
+
+    def test_parse_cat_args(
+        self,
+        load_fix_acr_db: bytes,
+        ccno_dsmz_1: tuple[int, CatArgs],
+        ccno_nrrl_1: tuple[int, CatArgs],
+        ccno_msu_418: tuple[int, CatArgs],
+        ccno_lmg_1_1: tuple[int, CatArgs],
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        ccnos = ["DSM 1", "NRRL B-1", "MSCU 418", "XYZ 1", "LMG 1t1"]
+        expected = [ccno_dsmz_1, ccno_nrrl_1, ccno_msu_418, ccno_lmg_1_1]
+        assert expected == list(parse_ccnos(ccnos, acr_db))
+        assert (13, CatArgs(acr="IMI", id="1aii", pre="", core="1", suf="aii")) in list(
+            parse_ccnos(["IMI 1aii"], acr_db)
+        )
+
+    def test_normalize_variants(self, load_fix_acr_db: bytes) -> None:
+        normalizer = CCNoNormalizer(parse_acr_db(json.loads(load_fix_acr_db)))
+        dsm_1234 = (
+            1,
+            "DSM 1234",
+            CatArgs(acr="DSM", id="1234", pre="", core="1234", suf=""),
+        )
+        for ccno in ["DSM 1234", "dsm-1234", "DSM  1234", "DSM_1234", "DSMZ 1234"]:
+            assert normalizer.normalize(ccno) == (dsm_1234,)
+        assert normalizer.normalize("nrrl b-1")[0][:2] == (17, "NRRL B-1")
+        assert normalizer.normalize("BCCM:ITM 5")[0][:2] == (10, "ITM 5")
+        assert normalizer.normalize("cirm bia 2288")[0][:2] == (71, "CIRM-BIA 2288")
+        assert normalizer.normalize("XYZ 1") == ()
+        assert normalizer.normalize("DSM") == ()
+        assert normalizer.reset_stats() == CCNoNormStats(
+            exact=2, normalized=6, unmatched=2
+        )
+        assert normalizer.stats.total == 0
+
+    def test_normalize_examples(
+        self, load_fix_acr_db: bytes, load_fix_regex_db: bytes
+    ) -> None:
+        normalizer = CCNoNormalizer(parse_acr_db(json.loads(load_fix_acr_db)))
+        for acr_id, ccnos in json.loads(load_fix_regex_db).items():
+            for ccno in ccnos:
+                found = normalizer.normalize(ccno)
+                assert int(acr_id) in [cid for cid, _, _ in found]
+                assert normalizer.normalize(found[0][1]) == found
+        assert normalizer.stats.normalized == 0
+        assert normalizer.stats.unmatched == 0
@@ -1,12 +1,24 @@
 import json
 
+import pytest
+
 from knacr.container.acr_db import CatArgs
+from knacr.container.fun.acr_db import replace_param_value
+from knacr.container.fun.template import compile_template
 from knacr.container.links import LinkLevel
-from knacr.library.catalogue import create_catalogue_link, create_ccno_links
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.catalogue import (
+    create_bulk_ccno_links,
+    create_catalogue_link,
+    create_ccno_links,
+    render_template,
+)
+from knacr.library.ccno import parse_ccnos
 from knacr.library.loader import parse_acr_db
+from knacr.library.metrics import MetricEvent
 
 
-pytest_plugins = ("tests.fixture.data", "tests.fixture.links")
+pytest_plugins = ("tests.fixture.data", "tests.fixture.links", "tests.fixture.metrics")
 
 
 class TestCcnoLink:
@@ -78,3 +90,59 @@ class TestCcnoLink:
         assert acr_db is not None
         cat = "https://bccm.belspo.be/page/lmg-catalogue-display/fields/name/LMG 1t1"
         assert cat in set(create_catalogue_link(acr_db, cat_args))
+
+    def test_template_optional(self) -> None:
+        href = "https://utex.org/products/{acr}-{pre}<->{core}"
+        with_pre = CatArgs(acr="UTEX", id="LB 12", pre="LB", suf="", core="12")
+        without_pre = CatArgs(acr="UTEX", id="12", pre="", suf="", core="12")
+        assert compile_template(href) is compile_template(href)
+        assert (
+            replace_param_value(href, with_pre) == "https://utex.org/products/UTEX-LB-12"
+        )
+        assert (
+            replace_param_value(href, without_pre) == "https://utex.org/products/UTEX-12"
+        )
+
+    def test_template_core_parts(self) -> None:
+        href = "https://www.ccap.ac.uk/catalogue/strain-{core:1}-{core:2}{suf}<.>{core:3}"
+        args = CatArgs(acr="CCAP", id="1/2 A", pre="", suf="A", core="1/2")
+        assert (
+            replace_param_value(href, args)
+            == "https://www.ccap.ac.uk/catalogue/strain-1-2A"
+        )
+
+    def test_link_bulk(self, load_fix_acr_db: bytes, load_fix_regex_db: bytes) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        ccnos = [ccno for exa in json.loads(load_fix_regex_db).values() for ccno in exa]
+        parsed = list(parse_ccnos(ccnos, acr_db))
+        for exclude in [(), (LinkLevel.cat,), (LinkLevel.home,)]:
+            single = [create_ccno_links(acr_db[cid], arg, exclude) for cid, arg in parsed]
+            assert single == create_bulk_ccno_links(acr_db, parsed, exclude)
+        with pytest.raises(ValJsonEx):
+            create_bulk_ccno_links(acr_db, [(len(acr_db) + 1, parsed[0][1])])
+
+    def test_link_metrics(
+        self,
+        metric_events: list[MetricEvent],
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+    ) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        ccnos = [ccno for exa in json.loads(load_fix_regex_db).values() for ccno in exa]
+        parsed = list(parse_ccnos(ccnos, acr_db))
+        metric_events.clear()
+        links = create_bulk_ccno_links(acr_db, parsed)
+        *renders, event = metric_events
+        assert event.name == "link_render"
+        assert event.count == sum(len(link.catalogue) for link in links)
+        assert len(renders) == event.count
+        assert all(eve.name == "template_render" for eve in renders)
+        metric_events.clear()
+        cat_links = list(create_catalogue_link(acr_db[parsed[0][0]], parsed[0][1]))
+        assert len(metric_events) == len(cat_links) > 0
+        metric_events.clear()
+        assert replace_param_value("https://x.org/{acr}", parsed[0][1]) == (
+            render_template("https://x.org/{acr}", parsed[0][1])
+        )
+        (event,) = metric_events
+        assert event.name == "template_render"
@@ -0,0 +1,79 @@
+import copy
+import json
+
+import pytest
+
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.diff import apply_acr_db_diff, diff_acr_db, diff_raw_acr_db
+from knacr.library.loader import parse_acr_db
+
+
+pytest_plugins = ("tests.fixture.data",)
+
+
+class TestDiff:
+    def test_diff_empty(self, load_fix_acr_db: bytes) -> None:
+        raw = json.loads(load_fix_acr_db)
+        assert diff_raw_acr_db(raw, copy.deepcopy(raw)).empty
+        assert diff_acr_db(parse_acr_db(raw), parse_acr_db(raw)).empty
+
+    def test_diff_fields(self, load_fix_acr_db: bytes) -> None:
+        old_raw = json.loads(load_fix_acr_db)
+        new_raw = copy.deepcopy(old_raw)
+        last = len(old_raw)
+        new_raw["2"]["name"] = "Renamed Collection"
+        new_raw["3"]["acr_synonym"] = [*new_raw["3"].get("acr_synonym", []), "ZZZ"]
+        new_raw[str(last + 1)] = {**new_raw["1"], "acr": "NEWDSM", "code": "NEWDSM"}
+        new_raw[str(last + 1)]["regex_ccno"] = r"^NEWDSM\s*\d+$"
+        diff = diff_raw_acr_db(old_raw, new_raw)
+        assert list(diff.added) == [last + 1]
+        assert diff.removed == ()
+        assert {
+            acr_id: [fie.name for fie in cha.fields]
+            for acr_id, cha in diff.modified.items()
+        } == {
+            2: ["name"],
+            3: ["acr_synonym"],
+        }
+        assert diff.modified[2].fields[0].new == "Renamed Collection"
+        assert diff == diff_acr_db(parse_acr_db(old_raw), parse_acr_db(new_raw))
+        assert diff_raw_acr_db(new_raw, old_raw).removed == (last + 1,)
+
+    def test_apply_diff(self, load_fix_acr_db: bytes) -> None:
+        old_raw = json.loads(load_fix_acr_db)
+        new_raw = copy.deepcopy(old_raw)
+        new_id = str(len(old_raw) + 1)
+        new_raw["2"]["name"] = "Renamed Collection"
+        new_raw[new_id] = {**new_raw["1"], "acr": "NEWDSM", "code": "NEWDSM"}
+        new_raw[new_id]["regex_ccno"] = r"^NEWDSM\s*\d+$"
+        acr_db = parse_acr_db(old_raw)
+        updated = apply_acr_db_diff(acr_db, diff_raw_acr_db(old_raw, new_raw))
+        assert updated == parse_acr_db(new_raw)
+        assert updated[1] is acr_db[1]
+        assert len(acr_db) == len(old_raw)
+        assert apply_acr_db_diff(updated, diff_acr_db(updated, acr_db)) == acr_db
+
+    def test_apply_diff_invalid(self, load_fix_acr_db: bytes) -> None:
+        old_raw = json.loads(load_fix_acr_db)
+        acr_db = parse_acr_db(old_raw)
+        target = next(
+            cha.id for acr_con in acr_db.values() for cha in acr_con.acr_changed_to
+        )
+        new_raw = copy.deepcopy(old_raw)
+        new_raw[str(target)] = {
+            key: val
+            for key, val in new_raw[str(target)].items()
+            if key not in ("homepage", "catalogue", "acr_synonym", "acr_changed_to")
+        }
+        new_raw[str(target)].update({"deprecated": True, "active": False})
+        with pytest.raises(ValJsonEx, match="deprecated"):
+            apply_acr_db_diff(acr_db, diff_raw_acr_db(old_raw, new_raw))
+        new_raw = copy.deepcopy(old_raw)
+        new_raw["2"].update({key: old_raw["1"][key] for key in ("acr", "code", "name")})
+        new_raw["2"]["country"] = old_raw["1"]["country"]
+        with pytest.raises(ValJsonEx, match="should be unique"):
+            apply_acr_db_diff(acr_db, diff_raw_acr_db(old_raw, new_raw))
+        new_raw = copy.deepcopy(old_raw)
+        del new_raw["2"]
+        with pytest.raises(ValJsonEx, match="missing acr id 2"):
+            apply_acr_db_diff(acr_db, diff_raw_acr_db(old_raw, new_raw))
@@ -0,0 +1,63 @@
+from pathlib import Path
+import pytest
+
+from knacr.errors.custom_exceptions import ReqURIEx
+from knacr.library.download import DownloadCache
+from tests.fixture.stand_in import DataServer
+
+
+pytest_plugins = ("tests.fixture.server",)
+
+
+class TestDownload:
+    def test_cache_revalidate(self, tmp_path: Path, data_server: DataServer) -> None:
+        data_server.body = b'{"1": ["DSM 1"]}'
+        cache = DownloadCache(tmp_path)
+        for _ in range(3):
+            body = cache.fetch(f"{data_server.url}/main/regex.json", "main", "regex_db")
+            assert body == data_server.body
+        assert len(data_server.requests) == 3
+        assert len(data_server.not_modified) == 2
+
+    def test_cache_changed(self, tmp_path: Path, data_server: DataServer) -> None:
+        cache = DownloadCache(tmp_path)
+        data_server.body = b'{"1": ["DSM 1"]}'
+        cache.fetch(f"{data_server.url}/latest/regex.json", "latest", "regex_db")
+        data_server.body, data_server.etag = b'{"1": ["DSM 2"]}', '"v2"'
+        body = cache.fetch(f"{data_server.url}/latest/regex.json", "latest", "regex_db")
+        assert body == b'{"1": ["DSM 2"]}'
+        entry = cache.load("latest", "regex_db")
+        assert entry is not None
+        assert entry.etag == '"v2"'
+
+    def test_cache_immutable(self, tmp_path: Path, data_server: DataServer) -> None:
+        cache = DownloadCache(tmp_path)
+        for _ in range(3):
+            cache.fetch(f"{data_server.url}/v0.7.0/acr.json", "v0.7.0", "acr_db")
+        assert len(data_server.requests) == 1
+
+    def test_cache_missing(self, tmp_path: Path, data_server: DataServer) -> None:
+        with pytest.raises(ReqURIEx):
+            DownloadCache(tmp_path).fetch(
+                f"{data_server.url}/main/missing.json", "main", "missing"
+            )
+        assert DownloadCache(tmp_path).load("main", "missing") is None
+
+    @pytest.mark.parametrize("version", ["", ".", ".."])
+    def test_cache_reserved_version(self, tmp_path: Path, version: str) -> None:
+        with pytest.raises(ReqURIEx):
+            DownloadCache(tmp_path).load(version, "acr_db")
+        assert not (tmp_path / "data").exists()
+
+    def test_cache_distinct_keys(self, tmp_path: Path, data_server: DataServer) -> None:
+        cache = DownloadCache(tmp_path)
+        for version in ("a/b", "a_b", "../a"):
+            data_server.body = f'{{"{version}": []}}'.encode()
+            cache.fetch(f"{data_server.url}/main/acr.json", version, "acr_db")
+        for version in ("a/b", "a_b", "../a"):
+            entry = cache.load(version, "acr_db")
+            assert entry is not None
+            assert entry.body == f'{{"{version}": []}}'.encode()
+        assert {path.parent for path in tmp_path.rglob("*.json")} == {
+            tmp_path / "data" / key for key in ("a%2Fb", "a_b", "..%2Fa")
+        }
@@ -1,11 +1,29 @@
+import asyncio
 import json
+import subprocess
+import sys
+from importlib.resources import files
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 import pytest
+from tests.fixture.stand_in import DataServer
+from knacr import data
 from knacr.constants.versions import CURRENT_VER, STABLE_VER
+from knacr.container.fun.acr_db import create_acr_min_projection
 
 from knacr.errors.custom_exceptions import ValJsonEx, ReqURIEx
+from knacr.errors.custom_warnings import LoadWarn
+from knacr.library import download
+from knacr.library.download import DownloadCache
 from knacr.library.loader import (
     _load_data,
+    create_current_min_projection,
+    create_current_snapshot,
+    load_acr_db_async,
+    load_all,
+    load_all_async,
+    load_catalogue_db_async,
+    load_regex_db_async,
     load_acr_db,
     load_min_acr_db,
     load_regex_db,
@@ -15,23 +33,32 @@ from knacr.library.loader import (
     parse_min_acr_db,
     parse_regex_db,
 )
+from knacr.library.metrics import MetricEvent
+from knacr.library.snapshot import SnapshotStore
+from knacr.main import run
 
-pytest_plugins = ("tests.fixture.data",)
+pytest_plugins = (
+    "tests.fixture.data",
+    "tests.fixture.cache",
+    "tests.fixture.server",
+    "tests.fixture.metrics",
+)
 
 
+@pytest.mark.usefixtures("tmp_download_cache")
 class TestLoader:
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_acr_db_success(self, req: MagicMock, load_fix_acr_db: bytes) -> None:
         resp = MagicMock()
         resp.ok = True
-        resp.json.return_value = json.loads(load_fix_acr_db)
+        resp.content = load_fix_acr_db
         req.get.return_value = resp
         try:
             load_acr_db("never_tag")
         except (ValJsonEx, ReqURIEx) as val_ex:
             pytest.fail(f"acr data malformed - {val_ex.message}")
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_acr_db_fail(self, req: MagicMock) -> None:
         resp = MagicMock()
         resp.ok = False
@@ -39,7 +66,7 @@ class TestLoader:
         with pytest.raises(ReqURIEx):
             _load_data("never_tag", "acr_db", parse_acr_db)
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_acr_db_current_success(self, req: MagicMock) -> None:
         resp = MagicMock()
         resp.ok = False
@@ -49,7 +76,7 @@ class TestLoader:
         except (ValJsonEx, ReqURIEx) as val_ex:
             pytest.fail(f"acr data malformed - {val_ex.message}")
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_min_acr_db_fail(self, req: MagicMock) -> None:
         resp = MagicMock()
         resp.ok = False
@@ -57,20 +84,59 @@ class TestLoader:
         with pytest.raises(ReqURIEx):
             _load_data("never_tag", "acr_db", parse_min_acr_db)
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_min_acr_db_success(
         self, req: MagicMock, load_fix_acr_db: bytes
     ) -> None:
         resp = MagicMock()
         resp.ok = True
-        resp.json.return_value = json.loads(load_fix_acr_db)
+        resp.content = load_fix_acr_db
         req.get.return_value = resp
         try:
             load_min_acr_db(STABLE_VER)
         except (ValJsonEx, ReqURIEx) as val_ex:
             pytest.fail(f"acr data malformed - {val_ex.message}")
 
-    @patch("knacr.library.loader.requests")
+    def test_min_projection_in_sync(self, tmp_path: Path) -> None:
+        path = create_current_min_projection(tmp_path / "acr_min_db.json")
+        assert path.read_bytes() == files(data).joinpath("acr_min_db.json").read_bytes()
+        assert load_min_acr_db(CURRENT_VER) == parse_min_acr_db(
+            json.loads(files(data).joinpath("acr_db.json").read_bytes())
+        )
+
+    def test_min_projection_cli(self, tmp_path: Path) -> None:
+        run(["min-db", str(out_file := tmp_path / "acr_min_db.json")])
+        assert (
+            out_file.read_bytes() == files(data).joinpath("acr_min_db.json").read_bytes()
+        )
+        with pytest.raises(SystemExit):
+            run(["min-db"])
+
+    @pytest.mark.parametrize("published", [True, False])
+    def test_load_min_acr_db_remote(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        published: bool,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        data_server.strict = True
+        base = f"/{STABLE_VER}/src/knacr/data"
+        data_server.files[f"{base}/acr_db.json"] = load_fix_acr_db
+        expected = parse_min_acr_db(json.loads(load_fix_acr_db))
+        if published:
+            data_server.files[f"{base}/acr_min_db.json"] = json.dumps(
+                create_acr_min_projection(json.loads(load_fix_acr_db))
+            ).encode()
+        assert load_min_acr_db(STABLE_VER) == expected
+        fetched = [path.rsplit("/", 1)[-1] for path in data_server.requests]
+        if published:
+            assert fetched == ["acr_min_db.json"]
+        else:
+            assert fetched == ["acr_min_db.json", "acr_db.json"]
+
+    @patch("knacr.library.download.requests")
     def test_load_regex_db_fail(self, req: MagicMock) -> None:
         resp = MagicMock()
         resp.ok = False
@@ -80,13 +146,13 @@ class TestLoader:
                 "never_tag", "regex_db", lambda reg_db: parse_regex_db(reg_db, {}, True)
             )
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_regex_db_success(
         self, req: MagicMock, load_fix_regex_db: bytes, load_fix_acr_db: bytes
     ) -> None:
         resp = MagicMock()
         resp.ok = True
-        resp.json.return_value = json.loads(load_fix_regex_db)
+        resp.content = load_fix_regex_db
         req.get.return_value = resp
         acr_db = parse_acr_db(json.loads(load_fix_acr_db))
         try:
@@ -94,7 +160,7 @@ class TestLoader:
         except (ValJsonEx, ReqURIEx) as val_ex:
             pytest.fail(f"regex data malformed - {val_ex.message}")
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_catalogue_db_fail(self, req: MagicMock) -> None:
         resp = MagicMock()
         resp.ok = False
@@ -104,16 +170,201 @@ class TestLoader:
                 "never_tag", "catalogue_db", lambda reg_db: parse_catalogue_db(reg_db, {})
             )
 
-    @patch("knacr.library.loader.requests")
+    @patch("knacr.library.download.requests")
     def test_load_catalogue_db_success(
         self, req: MagicMock, load_fix_catalogue_db: bytes, load_fix_acr_db: bytes
     ) -> None:
         resp = MagicMock()
         resp.ok = True
-        resp.json.return_value = json.loads(load_fix_catalogue_db)
+        resp.content = load_fix_catalogue_db
         req.get.return_value = resp
         acr_db = parse_acr_db(json.loads(load_fix_acr_db))
         try:
             load_catalogue_db(acr_db, STABLE_VER)
         except (ValJsonEx, ReqURIEx) as val_ex:
             pytest.fail(f"regex data malformed - {val_ex.message}")
+
+    def test_load_all_current(self) -> None:
+        bundle = load_all(CURRENT_VER)
+        assert bundle.version == CURRENT_VER
+        assert bundle.index.by_acr("DSM") == (1,)
+        assert set(bundle.regex_db.keys()) == set(bundle.acr_db.keys())
+        assert set(bundle.catalogue_db.keys()) <= set(bundle.acr_db.keys())
+
+    def test_load_all_remote(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        for db_name, body in [
+            ("acr_db", load_fix_acr_db),
+            ("regex_db", load_fix_regex_db),
+            ("catalogue_db", load_fix_catalogue_db),
+        ]:
+            data_server.files[f"/{STABLE_VER}/src/knacr/data/{db_name}.json"] = body
+        bundle = load_all(STABLE_VER)
+        assert bundle.version == STABLE_VER
+        assert len(bundle.acr_db) == len(json.loads(load_fix_acr_db))
+        assert len(data_server.requests) == 3
+
+    def test_load_all_metrics(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        metric_events: list[MetricEvent],
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        for db_name, body in [
+            ("acr_db", load_fix_acr_db),
+            ("regex_db", load_fix_regex_db),
+            ("catalogue_db", load_fix_catalogue_db),
+        ]:
+            data_server.files[f"/{STABLE_VER}/src/knacr/data/{db_name}.json"] = body
+        load_all(STABLE_VER)
+        assert capsys.readouterr().out == ""
+        names = {(eve.name, eve.labels.get("db_name", "")) for eve in metric_events}
+        for db_name in ["acr_db", "regex_db", "catalogue_db"]:
+            assert ("download", db_name) in names
+            assert ("json_decode", db_name) in names
+            assert ("model_build", db_name) in names
+            assert ("validate", db_name) in names
+        acr_dl = next(
+            eve
+            for eve in metric_events
+            if eve.name == "download" and eve.labels["db_name"] == "acr_db"
+        )
+        assert acr_dl.size == len(load_fix_acr_db)
+        assert all(eve.labels["outcome"] == "ok" for eve in metric_events)
+
+    def test_load_error_metrics(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        metric_events: list[MetricEvent],
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        with pytest.raises(ReqURIEx):
+            _load_data("never_tag", "missing", parse_acr_db)
+        (event,) = (eve for eve in metric_events if eve.name == "download")
+        assert event.labels == {
+            "version": "never_tag",
+            "db_name": "missing",
+            "outcome": "error",
+            "error": "ReqURIEx",
+        }
+
+    def test_load_async_current(self) -> None:
+        async def _load() -> None:
+            acr_db = await load_acr_db_async(CURRENT_VER)
+            assert acr_db == load_acr_db(CURRENT_VER)
+            regex_db = await load_regex_db_async(acr_db, CURRENT_VER)
+            assert regex_db == load_regex_db(acr_db, CURRENT_VER)
+            cat_db = await load_catalogue_db_async(acr_db)
+            assert cat_db == load_catalogue_db(acr_db)
+
+        asyncio.run(_load())
+
+    @patch("knacr.library.download.requests")
+    def test_load_async_fallback(self, req: MagicMock) -> None:
+        resp = MagicMock()
+        resp.ok = False
+        req.get.return_value = resp
+        req.Session.return_value.get.return_value = resp
+        with pytest.warns(LoadWarn, match="never_tag"):
+            acr_db = asyncio.run(load_acr_db_async("never_tag"))
+        assert acr_db == load_acr_db(CURRENT_VER)
+        with pytest.warns(LoadWarn, match="never_tag"):
+            bundle = asyncio.run(load_all_async("never_tag"))
+        assert bundle.version == CURRENT_VER
+
+    def test_load_all_async_remote(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        for db_name, body in [
+            ("acr_db", load_fix_acr_db),
+            ("regex_db", load_fix_regex_db),
+            ("catalogue_db", load_fix_catalogue_db),
+        ]:
+            data_server.files[f"/{STABLE_VER}/src/knacr/data/{db_name}.json"] = body
+        ticks: list[int] = []
+
+        async def _tick() -> None:
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def _load() -> str:
+            ticker = asyncio.create_task(_tick())
+            bundle = await load_all_async(STABLE_VER)
+            ticker.cancel()
+            return bundle.version
+
+        assert asyncio.run(_load()) == STABLE_VER
+        assert len(ticks) > 1
+        assert len(data_server.requests) == 3
+
+    def test_load_acr_db_snapshot(self, tmp_download_cache: DownloadCache) -> None:
+        acr_db = load_acr_db(CURRENT_VER)
+        with patch("knacr.library.loader.parse_acr_db") as parse:
+            parse.side_effect = AssertionError("snapshot was not used")
+            assert load_acr_db(CURRENT_VER) == acr_db
+        assert len(list((tmp_download_cache.root / "snapshots").iterdir())) == 1
+
+    def test_snapshot_refuses_foreign_files(
+        self, tmp_path: Path, load_fix_acr_db: bytes
+    ) -> None:
+        store = SnapshotStore(tmp_path / "snapshots")
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        path = store.store(load_fix_acr_db, acr_db)
+        assert path is not None
+        assert path.stat().st_mode & 0o077 == 0
+        assert store.load(load_fix_acr_db) == acr_db
+        path.chmod(0o664)
+        assert store.load(load_fix_acr_db) is None
+        path.chmod(0o600)
+        store.root.chmod(0o777)
+        assert store.load(load_fix_acr_db) is None
+        store.root.chmod(0o700)
+        path.write_bytes(b"no pickle")
+        assert store.load(load_fix_acr_db) is None
+
+    def test_create_current_snapshot(
+        self, tmp_path: Path, load_fix_acr_db: bytes
+    ) -> None:
+        path = create_current_snapshot(tmp_path)
+        assert path is not None
+        assert path.is_file()
+        snap = SnapshotStore(tmp_path).load(load_fix_acr_db)
+        assert snap == parse_acr_db(json.loads(load_fix_acr_db))
+        assert SnapshotStore(tmp_path).load(load_fix_acr_db + b" ") is None
+
+    @pytest.mark.parametrize(
+        ("module", "lazy"),
+        [
+            ("knacr.library.loader", ("requests", "asyncio")),
+            ("knacr.library.registry", ("requests",)),
+            ("knacr.library.server", ("requests",)),
+            ("knacr.library.batch", ("requests",)),
+            ("knacr.main", ("requests", "pydantic")),
+        ],
+    )
+    def test_import_is_lazy(self, module: str, lazy: tuple[str, ...]) -> None:
+        probe = f"import sys, {module}; print(' '.join(sorted(sys.modules)))"
+        proc = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", probe], capture_output=True, check=True, text=True
+        )
+        assert set(proc.stdout.split()).isdisjoint(lazy)
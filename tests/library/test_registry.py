@@ -0,0 +1,137 @@
+import json
+import time
+
+import pytest
+
+from knacr.constants.versions import CURRENT_VER, STABLE_VER
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.errors.custom_warnings import LoadWarn
+from knacr.container.bundle import DbBundle
+from knacr.library import download, registry
+from knacr.library.loader import create_bundle
+from knacr.library.registry import RegistryHolder
+from tests.fixture.stand_in import DataServer
+
+pytest_plugins = ("tests.fixture.data", "tests.fixture.cache", "tests.fixture.server")
+
+
+def _serve(
+    data_server: DataServer, acr_db: bytes, regex_db: bytes, cat_db: bytes, etag: str, /
+) -> None:
+    data_server.etag = etag
+    for db_name, body in [
+        ("acr_db", acr_db),
+        ("regex_db", regex_db),
+        ("catalogue_db", cat_db),
+    ]:
+        data_server.files[f"/{STABLE_VER}/src/knacr/data/{db_name}.json"] = body
+
+
+def _rename(acr_db: bytes, name: str, /) -> bytes:
+    raw = json.loads(acr_db)
+    raw["1"]["name"] = name
+    return json.dumps(raw).encode()
+
+
+@pytest.mark.usefixtures("tmp_download_cache")
+class TestRegistry:
+    def test_registry_refresh(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        _serve(
+            data_server, load_fix_acr_db, load_fix_regex_db, load_fix_catalogue_db, '"a"'
+        )
+        holder = RegistryHolder(STABLE_VER)
+        first = holder.bundle
+        assert first.version == STABLE_VER
+        assert not holder.refresh()
+        assert holder.bundle is first
+        renamed = _rename(load_fix_acr_db, "Renamed Collection")
+        _serve(data_server, renamed, load_fix_regex_db, load_fix_catalogue_db, '"b"')
+        assert holder.refresh()
+        assert holder.bundle.acr_db[1].name == "Renamed Collection"
+        assert first.acr_db[1].name != "Renamed Collection"
+        _serve(data_server, b"[]", load_fix_regex_db, load_fix_catalogue_db, '"c"')
+        second = holder.bundle
+        assert not holder.refresh()
+        assert isinstance(holder.last_error, ValJsonEx)
+        assert holder.bundle is second
+        _serve(data_server, b'{"1": {', load_fix_regex_db, load_fix_catalogue_db, '"d"')
+        assert not holder.refresh()
+        assert isinstance(holder.last_error, ValJsonEx)
+        assert holder.bundle is second
+
+    def test_registry_background(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        _serve(
+            data_server, load_fix_acr_db, load_fix_regex_db, load_fix_catalogue_db, '"a"'
+        )
+        with RegistryHolder(STABLE_VER, 0.05) as holder:
+            renamed = _rename(load_fix_acr_db, "Background Collection")
+            _serve(data_server, renamed, load_fix_regex_db, load_fix_catalogue_db, '"b"')
+            deadline = time.monotonic() + 10
+            while holder.bundle.acr_db[1].name != "Background Collection":
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+
+    def test_registry_background_survives(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        data_server: DataServer,
+        load_fix_acr_db: bytes,
+        load_fix_regex_db: bytes,
+        load_fix_catalogue_db: bytes,
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        _serve(
+            data_server, load_fix_acr_db, load_fix_regex_db, load_fix_catalogue_db, '"a"'
+        )
+        failures = [RuntimeError("boom")]
+
+        def _create_bundle(version: str, raw: list[bytes], /) -> DbBundle:
+            if len(failures) > 0:
+                raise failures.pop()
+            return create_bundle(version, raw)
+
+        with RegistryHolder(STABLE_VER, 0.05) as holder:
+            monkeypatch.setattr(registry, "create_bundle", _create_bundle)
+            renamed = _rename(load_fix_acr_db, "Survivor Collection")
+            _serve(data_server, renamed, load_fix_regex_db, load_fix_catalogue_db, '"b"')
+            deadline = time.monotonic() + 10
+            while holder.bundle.acr_db[1].name != "Survivor Collection":
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+        assert len(failures) == 0
+
+    def test_registry_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, data_server: DataServer
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        data_server.body = b"[]"
+        with pytest.warns(LoadWarn):
+            holder = RegistryHolder(STABLE_VER)
+        assert holder.bundle.version == CURRENT_VER
+        assert holder.last_error is not None
+
+    def test_registry_fallback_truncated(
+        self, monkeypatch: pytest.MonkeyPatch, data_server: DataServer
+    ) -> None:
+        monkeypatch.setattr(download, "_KNACR_RAW", data_server.url)
+        data_server.body = b'{"1": '
+        with pytest.warns(LoadWarn):
+            holder = RegistryHolder(STABLE_VER)
+        assert holder.bundle.version == CURRENT_VER
+        assert isinstance(holder.last_error, ValJsonEx)
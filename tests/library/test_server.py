@@ -0,0 +1,123 @@
+from collections.abc import Iterator
+import json
+import socket
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+from unittest.mock import MagicMock, patch
+import urllib.error
+import urllib.request
+
+import pytest
+
+from knacr.constants.versions import CURRENT_VER
+from knacr.library.registry import RegistryHolder
+from knacr.library.resolver import CCNoResolver
+from knacr.library.server import create_server
+from knacr.main import run
+
+
+pytest_plugins = ("tests.fixture.cache",)
+
+
+@pytest.fixture(scope="module")
+def resolver_url() -> Iterator[str]:
+    server = create_server(RegistryHolder(CURRENT_VER), "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str, /) -> Any:
+    with urllib.request.urlopen(url, timeout=10) as res:  # noqa: S310
+        return json.loads(res.read())
+
+
+def _post(url: str, body: bytes, /) -> Any:
+    req = urllib.request.Request(url, data=body, method="POST")  # noqa: S310
+    with urllib.request.urlopen(req, timeout=10) as res:  # noqa: S310
+        return json.loads(res.read())
+
+
+class TestServer:
+    def test_identify(self, resolver_url: str) -> None:
+        res = _get(f"{resolver_url}/identify?ccno=DSM%201")
+        assert [mat["id"] for mat in res["matches"]] == [1]
+        assert res["matches"][0]["args"]["core"] == "1"
+
+    def test_resolve(self, resolver_url: str) -> None:
+        res = _get(f"{resolver_url}/resolve?name=DSMZ")
+        assert [ent["id"] for ent in res["entries"]] == [1]
+
+    def test_links(self, resolver_url: str) -> None:
+        res = _get(f"{resolver_url}/links?ccno=DSM%201")
+        assert res["links"][0]["level"] == "catalogue"
+        res = _get(f"{resolver_url}/links?ccno=DSM%201&exclude=catalogue")
+        assert res["links"][0]["level"] == "homepage"
+
+    def test_batch(self, resolver_url: str) -> None:
+        ccnos = ["DSM 1", "XYZ 1", *(f"DSM {num}" for num in range(2, 5000))]
+        res = _post(f"{resolver_url}/batch", json.dumps({"ccnos": ccnos}).encode())
+        assert len(res["results"]) == len(ccnos)
+        assert res["results"][1]["matches"] == []
+        body = json.dumps({"ccnos": ccnos[:2], "links": True}).encode()
+        res = _post(f"{resolver_url}/batch", body)
+        assert res["results"][0]["links"][0]["catalogue"] != []
+
+    def test_errors(self, resolver_url: str) -> None:
+        for url, code in [
+            (f"{resolver_url}/identify", 400),
+            (f"{resolver_url}/links?ccno=DSM%201&exclude=any", 400),
+            (f"{resolver_url}/unknown", 404),
+        ]:
+            with pytest.raises(urllib.error.HTTPError) as err:
+                _get(url)
+            assert err.value.code == code
+        for body in [
+            {},
+            {"ccnos": ["DSM 1"], "links": True, "exclude": 5},
+            {"ccnos": ["DSM 1"], "links": True, "exclude": [5]},
+            {"ccnos": ["DSM 1"], "links": True, "exclude": ["any"]},
+            {"ccnos": ["DSM 1"], "links": "yes"},
+            {"ccnos": "DSM 1"},
+        ]:
+            with pytest.raises(urllib.error.HTTPError) as err:
+                _post(f"{resolver_url}/batch", json.dumps(body).encode())
+            assert err.value.code == 400
+            assert "error" in json.loads(err.value.read())
+
+    @pytest.mark.parametrize("length", ["999999999", "0", "x"])
+    def test_bad_body_closes(self, resolver_url: str, length: str) -> None:
+        url = urlsplit(resolver_url)
+        smuggled = b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        with socket.create_connection((url.hostname, url.port), timeout=10) as sock:
+            sock.sendall(
+                b"POST /batch HTTP/1.1\r\nHost: x\r\nConnection: keep-alive\r\n"
+                + f"Content-Length: {length}\r\n\r\n".encode()
+                + smuggled
+            )
+            res = b""
+            while len(chunk := sock.recv(4096)) > 0:
+                res += chunk
+        assert res.startswith(b"HTTP/1.1 400 ")
+        assert res.count(b"HTTP/1.1 ") == 1
+        assert b"Connection: close" in res
+
+    def test_internal_error(self, resolver_url: str) -> None:
+        with (
+            patch.object(CCNoResolver, "identify", side_effect=RuntimeError("boom")),
+            pytest.raises(urllib.error.HTTPError) as err,
+        ):
+            _get(f"{resolver_url}/identify?ccno=DSM%201")
+        assert err.value.code == 500
+        assert json.loads(err.value.read()) == {"error": "internal server error"}
+        assert _get(f"{resolver_url}/health")["version"] == CURRENT_VER
+
+    @patch("knacr.library.server.serve")
+    def test_run(self, serve: MagicMock) -> None:
+        run(["--port", "0"])
+        holder, host, port = serve.call_args.args
+        assert holder.bundle.version == CURRENT_VER
+        assert (host, port) == ("127.0.0.1", 0)
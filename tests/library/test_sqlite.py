@@ -0,0 +1,129 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from knacr.constants.versions import CURRENT_VER
+from knacr.container.acr_db import AcrChaT
+from knacr.container.bundle import DbBundle
+from knacr.container.fun.format import uuid_to_str
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library import sqlite as sqlite_mod
+from knacr.library.loader import load_all
+from knacr.library.sqlite import SqliteAcrDb, export_sqlite
+from knacr.main import run
+
+
+pytest_plugins = ("tests.fixture.cache",)
+
+
+@pytest.fixture(scope="module")
+def bundle() -> DbBundle:
+    return load_all(CURRENT_VER)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path: Path, bundle: DbBundle) -> Path:
+    return export_sqlite(
+        tmp_path / "knacr.sqlite",
+        bundle.acr_db,
+        bundle.regex_db,
+        bundle.catalogue_db,
+        bundle.version,
+    )
+
+
+class TestSqlite:
+    def test_sqlite_round_trip(self, sqlite_path: Path, bundle: DbBundle) -> None:
+        with SqliteAcrDb(sqlite_path) as reg:
+            assert reg.version == bundle.version
+            assert len(reg) == len(bundle.acr_db)
+            assert reg.to_acr_db() == bundle.acr_db
+            assert reg.to_regex_db() == bundle.regex_db
+            assert reg.to_catalogue_db() == bundle.catalogue_db
+            assert 1 in reg
+            assert 0 not in reg
+            with pytest.raises(KeyError):
+                reg[0]
+
+    def test_sqlite_queries(self, sqlite_path: Path, bundle: DbBundle) -> None:
+        index = bundle.index
+        with SqliteAcrDb(sqlite_path) as reg:
+            for acr_id, acr_con in bundle.acr_db.items():
+                assert reg.by_acr(acr_con.acr) == index.by_acr(acr_con.acr)
+                assert reg.by_code(acr_con.code) == index.by_code(acr_con.code)
+                assert reg.by_ror(acr_con.ror) == index.by_ror(acr_con.ror)
+                gbif = uuid_to_str(acr_con.gbif)
+                assert reg.by_gbif(gbif) == index.by_gbif(gbif)
+                assert acr_id in reg.by_country(acr_con.country)
+                assert acr_id in reg.by_status(acr_con.active, acr_con.deprecated)
+                for syn in acr_con.acr_synonym:
+                    assert reg.by_synonym(syn) == index.by_synonym(syn)
+                    assert reg.lookup(syn) == index.lookup(syn)
+                assert reg.changed_to(acr_id) == tuple(
+                    (cha.id, cha.type) for cha in acr_con.acr_changed_to
+                )
+                for cha in acr_con.acr_changed_to:
+                    assert (acr_id, cha.type) in reg.changed_from(cha.id)
+                assert reg.regex_examples(acr_id) == bundle.regex_db[acr_id]
+            assert reg.lookup("") == ()
+            assert all(
+                isinstance(typ, AcrChaT)
+                for acr_id in reg
+                for _, typ in reg.changed_to(acr_id)
+            )
+
+    def test_sqlite_read_only(self, sqlite_path: Path) -> None:
+        with SqliteAcrDb(sqlite_path, 2) as reg:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                found = list(pool.map(reg.by_acr, ["DSM"] * 64))
+            assert found == [(1,)] * 64
+        con = sqlite3.connect(f"{sqlite_path.as_uri()}?mode=ro", uri=True)
+        with pytest.raises(sqlite3.OperationalError):
+            con.execute("DELETE FROM acr")
+        con.close()
+        with pytest.raises(ValJsonEx):
+            SqliteAcrDb(sqlite_path.with_name("missing.sqlite"))
+
+    def test_sqlite_closed(self, sqlite_path: Path) -> None:
+        reg = SqliteAcrDb(sqlite_path, 2)
+        assert reg[1].acr == "DSM"
+        reg.close()
+        reg.close()
+        for query in (lambda: reg[1], reg.to_regex_db, lambda: reg.by_acr("DSM")):
+            with pytest.raises(sqlite3.ProgrammingError, match="is closed"):
+                query()
+
+    def test_sqlite_invalid(self, tmp_path: Path) -> None:
+        (text_file := tmp_path / "text.sqlite").write_text("not a database " * 100)
+        (empty_db := tmp_path / "empty.sqlite").touch()
+        sqlite3.connect(other_db := tmp_path / "other.sqlite").execute(
+            "CREATE TABLE other (id INTEGER)"
+        ).connection.close()
+        for path in (text_file, empty_db, other_db):
+            with pytest.raises(ValJsonEx, match="is not a sqlite registry"):
+                SqliteAcrDb(path)
+
+    def test_sqlite_export_cleanup(
+        self, tmp_path: Path, bundle: DbBundle, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def _fail(*_args: object) -> None:
+            raise sqlite3.IntegrityError("broken")
+
+        monkeypatch.setattr(sqlite_mod, "_write_sqlite", _fail)
+        with pytest.raises(sqlite3.IntegrityError):
+            export_sqlite(
+                tmp_path / "knacr.sqlite",
+                bundle.acr_db,
+                bundle.regex_db,
+                bundle.catalogue_db,
+                bundle.version,
+            )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sqlite_cli(self, tmp_path: Path, bundle: DbBundle) -> None:
+        out_file = tmp_path / "cli.sqlite"
+        run(["export", str(out_file)])
+        with SqliteAcrDb(out_file) as reg:
+            assert reg.to_acr_db() == bundle.acr_db
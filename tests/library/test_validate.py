@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from knacr.container.acr_db import AcrChaCon, AcrChaT, AcrCoreReg
+from knacr.container.successor import AcrSuccessors
+from knacr.errors.custom_exceptions import ValJsonEx
+from knacr.library.loader import parse_acr_db
+from knacr.library.validate import _check_or_order, _check_regex
+
+
+pytest_plugins = ("tests.fixture.data",)
+
+
+class TestValidate:
+    @pytest.mark.parametrize(
+        ("regex", "shadow"),
+        [("(B|BAA)-", "B"), ("(AB|A|ABC)", "AB"), ("(X|Y|XY)", "X"), ("A|A", "A")],
+    )
+    def test_or_order_shadowed(self, regex: str, shadow: str) -> None:
+        with pytest.raises(ValJsonEx) as err:
+            _check_or_order(regex, 7)
+        assert err.value.message == (
+            "regex for collection 7 has a smaller substring"
+            f" before the longer string {shadow} - {regex}"
+        )
+
+    @pytest.mark.parametrize(
+        "regex",
+        ["(BAA|B)-", "(L|ISP|WC|HD|NRS|S|BD|B|YB|Y)-", "[AB]|C", "ABC", ""],
+    )
+    def test_or_order_valid(self, regex: str) -> None:
+        _check_or_order(regex, 7)
+
+    @pytest.mark.parametrize(
+        ("reg", "message"),
+        [
+            (
+                {"full": r"^(B-)?\d+$", "core": r"\d+", "pre": "C-"},
+                "prefix defines a different C- regex than the full id",
+            ),
+            (
+                {"full": r"^(B-)?\d+$", "core": r"\d+"},
+                "prefix defines a different  regex than the full id",
+            ),
+            (
+                {"full": r"^\d+$", "core": r"\d+", "suf": "x"},
+                "suffix defines a different x regex than the full id",
+            ),
+            (
+                {"full": r"^(B-)?\d+x$", "core": r"\d+", "pre": "B-", "suf": "y"},
+                "suffix defines a different y regex than the full id",
+            ),
+        ],
+    )
+    def test_regex_part_mismatch(self, reg: dict[str, str], message: str) -> None:
+        with pytest.raises(ValJsonEx) as err:
+            _check_regex(rf"^NRRL\s*{reg['full'][1:]}", AcrCoreReg(**reg), 7)
+        assert err.value.message == message
+
+    def test_regex_parts_match(self) -> None:
+        reg = AcrCoreReg(full=r"^(B-)?\d+x?$", core=r"\d+", pre="B-", suf="x")
+        _check_regex(r"^NRRL\s*(B-)?\d+x?$", reg, 7)
+        with pytest.raises(ValJsonEx, match="must contain regex for id"):
+            _check_regex(r"^NRRL\s*\d+$", reg, 7)
+
+    @pytest.mark.parametrize("cycle", [(25,), (25, 26, 31), (1, 2)])
+    def test_successor_loop(self, load_fix_acr_db: bytes, cycle: tuple[int, ...]) -> None:
+        acr_db = parse_acr_db(json.loads(load_fix_acr_db))
+        for src, dst in zip(cycle, (*cycle[1:], cycle[0]), strict=True):
+            edge = [AcrChaCon(id=dst, type=AcrChaT.unk)]
+            acr_db[src] = acr_db[src].model_copy(update={"acr_changed_to": edge})
+        with pytest.raises(ValJsonEx, match="loop detected"):
+            AcrSuccessors(acr_db)